@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.config import get_settings
+from src.core.clients.jira_client import JiraClient
+from src.core.services.ingestion_service import WebhookIngestor, build_ingestor
+
+WEBHOOK_PATH = "/webhooks/jira"
+
+
+def make_handler(ingestor: WebhookIngestor, secret: str = ""):
+    class JiraWebhookHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            if self.path.split("?", 1)[0] != WEBHOOK_PATH:
+                self._reply(404, {"error": "not found"})
+                return
+
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if secret and not _valid_signature(secret, body, self.headers.get("X-Hub-Signature", "")):
+                self._reply(401, {"error": "invalid signature"})
+                return
+
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                self._reply(400, {"error": "invalid JSON"})
+                return
+
+            try:
+                accepted = ingestor.submit(payload, self.headers.get("X-Atlassian-Webhook-Identifier"))
+            except ValueError as exc:
+                self._reply(400, {"error": str(exc)})
+                return
+            self._reply(202, {"accepted": accepted})
+
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path != "/health":
+                self._reply(404, {"error": "not found"})
+                return
+            self._reply(200, {"issues": len(ingestor.store), **ingestor.stats})
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002
+            return
+
+        def _reply(self, status: int, body: dict) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return JiraWebhookHandler
+
+
+def _valid_signature(secret: str, body: bytes, header: str) -> bool:
+    expected = "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, header)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Receive Jira issue webhooks.")
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Interface to bind; non-loopback hosts require JIRA_WEBHOOK_SECRET.",
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings["jira_webhook_secret"] and not _is_loopback(args.host):
+        parser.error("set JIRA_WEBHOOK_SECRET before listening on a non-loopback host")
+
+    logging.basicConfig(level=logging.INFO)
+    ingestor = build_ingestor(settings)
+    # The receiver is the store's only writer, so it also does the initial fill.
+    ingestor.seed(
+        JiraClient(
+            base_url=settings["jira_base_url"],
+            email=settings["jira_email"],
+            api_token=settings["jira_api_token"],
+            verify_ssl=settings["jira_verify_ssl"],
+        ),
+        settings["jira_default_jql"],
+    )
+    ingestor.start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(ingestor, settings["jira_webhook_secret"]))
+    print(f"Listening for Jira webhooks on http://{args.host}:{args.port}{WEBHOOK_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ingestor.flush()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
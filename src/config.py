@@ -16,9 +16,11 @@ def get_settings() -> Dict[str, str]:
         "jira_api_token": os.getenv("JIRA_API_TOKEN", "").strip(),
         "jira_verify_ssl": os.getenv("JIRA_VERIFY_SSL", "true").lower() != "false",
         "jira_default_jql": os.getenv("JIRA_JQL"),
+        "jira_webhook_secret": os.getenv("JIRA_WEBHOOK_SECRET", "").strip(),
         "report_output_dir": os.getenv("REPORT_OUTPUT_DIR", "./outputs/reports"),
         "summary_output_dir": os.getenv("SUMMARY_OUTPUT_DIR", "./outputs/summaries"),
         "log_output_dir": os.getenv("LOG_OUTPUT_DIR", "./outputs/logs"),
+        "cache_output_dir": os.getenv("CACHE_OUTPUT_DIR", "./outputs/cache"),
     }
 
     _ensure_directories(settings)
@@ -31,6 +33,7 @@ def _ensure_directories(settings: Dict[str, str]) -> None:
         settings["report_output_dir"],
         settings["summary_output_dir"],
         settings["log_output_dir"],
+        settings["cache_output_dir"],
     ]
     for d in dirs:
         Path(d).mkdir(parents=True, exist_ok=True)
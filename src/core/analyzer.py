@@ -1,27 +1,70 @@
 from __future__ import annotations
 
-from collections import Counter
-from typing import Dict, Iterable, List
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
 
+from src.core.dependencies import DependencyGraph
+from src.core.hierarchy import HierarchyIndex, is_done
 from src.models.issue import Issue
 
+MAX_LISTED_DUPLICATES = 10
 
-def analyze_issues(issues: Iterable[Issue]) -> Dict[str, object]:
-    """Compute basic aggregates for a batch of issues."""
+
+def analyze_issues(
+        issues: Iterable[Issue],
+        hierarchy: Optional[HierarchyIndex] = None,
+        graph: Optional[DependencyGraph] = None,
+) -> Dict[str, object]:
+    """
+    Compute basic aggregates for a batch of issues.
+
+    ``hierarchy`` and ``graph`` are indexes already kept up to date for exactly
+    these issues; any that are missing are built from the batch.
+    """
     issue_list: List[Issue] = list(issues)
     priorities = Counter(issue.priority for issue in issue_list)
     statuses = Counter(issue.status for issue in issue_list)
+    hierarchy = hierarchy if hierarchy is not None else HierarchyIndex(issue_list)
+    graph = graph if graph is not None else DependencyGraph(issue_list)
+
+    # How many open issues each issue holds up through "blocks" links.
+    blocked_counts = graph.blocked_counts()
+    blocking = {
+        issue.id: blocked_counts[issue.id]
+        for issue in issue_list
+        if blocked_counts.get(issue.id)
+    }
+
     blockers = [
         issue
         for issue in issue_list
-        if issue.is_blocker or issue.status.lower() == "blocked"
+        if issue.is_blocker
+        or issue.status.lower() == "blocked"
+        or (issue.id in blocking and not is_done(issue))
     ]
+    blockers.sort(key=lambda issue: -blocking.get(issue.id, 0))
+
+    epics = hierarchy.epics()
+    members: Dict[str, List[str]] = defaultdict(list)
+    for issue in issue_list:
+        members[hierarchy.root_of(issue.id)].append(issue.id)
+    critical_paths = {}
+    for epic in epics:
+        path = graph.critical_path(members[epic["id"]])
+        if len(path) > 1:
+            critical_paths[epic["id"]] = path
 
     return {
         "total": len(issue_list),
         "priorities": priorities,
         "statuses": statuses,
         "blockers": blockers,
+        "epics": epics,
+        "dependencies": {
+            "blocking": blocking,
+            "cycles": graph.cycles(),
+            "critical_paths": critical_paths,
+        },
     }
 
 
@@ -44,12 +87,45 @@ def format_summary(summary: Dict[str, object]) -> str:
     for status, count in summary["statuses"].most_common():
         lines.append(f"  - {status}: {count}")
 
+    if summary["epics"]:
+        lines.append("")
+        lines.append("Epic progress:")
+        for epic in summary["epics"]:
+            title = f" {epic['title']}" if epic["title"] else ""
+            lines.append(
+                f"  - {epic['id']}:{title} {epic['completion']:g}% complete "
+                f"({epic['done']}/{epic['total']} done, focus {epic['focus']:.0%})"
+            )
+
+    if summary.get("duplicates"):
+        lines.append("")
+        lines.append("Possible duplicates:")
+        for group in summary["duplicates"]:
+            keys = ", ".join(issue.id for issue in group[:MAX_LISTED_DUPLICATES])
+            if len(group) > MAX_LISTED_DUPLICATES:
+                keys += f" (+{len(group) - MAX_LISTED_DUPLICATES} more)"
+            lines.append(f"  - {keys}: {group[0].title}")
+
     if summary["blockers"]:
         lines.append("")
         lines.append("Current blockers:")
+        blocking = summary["dependencies"]["blocking"]
         for blocker in summary["blockers"]:
+            impact = f", blocks {blocking[blocker.id]}" if blocking.get(blocker.id) else ""
             lines.append(
-                f"  - {blocker.id}: {blocker.title} (assignee: {blocker.assignee or 'unassigned'})"
+                f"  - {blocker.id}: {blocker.title} (assignee: {blocker.assignee or 'unassigned'}{impact})"
             )
 
+    if summary["dependencies"]["critical_paths"]:
+        lines.append("")
+        lines.append("Critical blocker chains:")
+        for epic_id, path in summary["dependencies"]["critical_paths"].items():
+            lines.append(f"  - {epic_id}: {' -> '.join(path)}")
+
+    if summary["dependencies"]["cycles"]:
+        lines.append("")
+        lines.append("Dependency cycles:")
+        for cycle in summary["dependencies"]["cycles"]:
+            lines.append(f"  - {', '.join(cycle)}")
+
     return "\n".join(lines)
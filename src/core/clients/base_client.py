@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from src.models.issue import Issue
 
@@ -14,6 +14,14 @@ class BaseClient(ABC):
         """Return issues from the data source."""
         raise NotImplementedError
 
+    def refresh_issues(
+            self,
+            keys: Iterable[str],
+            known: Optional[Iterable[Issue]] = None,
+    ) -> Tuple[List[Issue], List[str]]:
+        """Re-read issues by key; return those that changed and the keys that are gone."""
+        raise NotImplementedError
+
     def fetch_projects(self) -> List[str]:
         """Return available project keys or names."""
         raise NotImplementedError
@@ -33,3 +41,11 @@ class BaseClient(ABC):
     def fetch_labels(self, query: str = "") -> List[str]:
         """Return label names, optionally filtered by a search prefix."""
         raise NotImplementedError
+
+    def fetch_all_assignees(self) -> List[str]:
+        """Return every assignable user's display name (all pages)."""
+        raise NotImplementedError
+
+    def fetch_all_labels(self) -> List[str]:
+        """Return every label name (all pages)."""
+        raise NotImplementedError
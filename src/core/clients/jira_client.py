@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
 
 import requests
 from requests.auth import HTTPBasicAuth
 
 from src.core.clients.base_client import BaseClient
+from src.core.clients.jql import MAX_IN_VALUES, JqlQuery
 from src.models.issue import Issue
 
+DEFAULT_FIELDS = [
+    "summary",
+    "status",
+    "priority",
+    "assignee",
+    "labels",
+    "issuetype",
+    "parent",
+    "description",
+    "updated",
+    "issuelinks",
+]
+BULK_FETCH_LIMIT = 100
+
 
 class JiraClient(BaseClient):
     """Jira REST client (v3) that maps issues to the local Issue model."""
@@ -19,11 +36,15 @@ class JiraClient(BaseClient):
             api_token: str,
             verify_ssl: bool = True,
             timeout: int = 10,
+            max_in_values: int = MAX_IN_VALUES,
+            max_workers: int = 4,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.auth = HTTPBasicAuth(email, api_token)
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        self.max_in_values = max_in_values
+        self.max_workers = max_workers
 
     def fetch_issues(
             self,
@@ -41,7 +62,10 @@ class JiraClient(BaseClient):
         Fetch issues from Jira using JQL with optional filters,
         yielding Issue domain models.
         """
-        built_jql = jql or self._build_jql(
+        items = self.fetch_raw_issues(
+            jql=jql,
+            fields=fields,
+            max_results=max_results,
             project_keys=project_keys,
             statuses=statuses,
             priorities=priorities,
@@ -49,27 +73,80 @@ class JiraClient(BaseClient):
             labels=labels,
             text_search=text_search,
         )
+        for item in items:
+            yield self._to_issue(item)
 
-        url = f"{self.base_url}/rest/api/3/search/jql"
+    def fetch_raw_issues(
+            self,
+            jql: Optional[str] = None,
+            fields: Optional[List[str]] = None,
+            max_results: int = 50,
+            project_keys: Optional[List[str]] = None,
+            statuses: Optional[List[str]] = None,
+            priorities: Optional[List[str]] = None,
+            assignees: Optional[List[str]] = None,
+            labels: Optional[List[str]] = None,
+            text_search: Optional[str] = None,
+    ) -> List[dict]:
+        """Same search as fetch_issues, returning Jira's raw issue JSON unmapped."""
+        built_jql = jql or self._build_jql(
+            project_keys=project_keys,
+            statuses=statuses,
+            priorities=priorities,
+            assignees=assignees,
+            labels=labels,
+            text_search=text_search,
+        )
 
-        fields_list = fields or [
-            "summary",
-            "status",
-            "priority",
-            "assignee",
-            "labels",
-        ]
+        fields_list = fields or DEFAULT_FIELDS
 
-        payload = {
-            "jql": built_jql,
-            "fields": fields_list,
-            "maxResults": max_results,
-        }
+        # The query is only rewritten when an IN list is too long to send as is.
+        query = JqlQuery.parse(built_jql)
+        sub_queries = query.split(self.max_in_values) if query is not None else []
+        if len(sub_queries) < 2:
+            return self._search(built_jql, fields_list, max_results)
+        return self._search_split(query, sub_queries, fields_list, max_results)
 
-        print(url, payload)
+    def refresh_issues(
+            self,
+            keys: Iterable[str],
+            known: Optional[Iterable[Issue]] = None,
+            fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Issue], List[str]]:
+        """
+        Re-read issues by key through the bulk fetch endpoint (100 keys per request,
+        requests run concurrently). Returns the issues that differ from ``known``
+        and the requested keys Jira no longer returns (deleted, moved or hidden).
+        """
+        unique_keys = list(dict.fromkeys(k for k in keys if k))
+        if not unique_keys:
+            return [], []
+        known_by_id = {issue.id: issue for issue in known or []}
+        fields_list = fields or DEFAULT_FIELDS
+
+        batches = [
+            unique_keys[i:i + BULK_FETCH_LIMIT]
+            for i in range(0, len(unique_keys), BULK_FETCH_LIMIT)
+        ]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            pages = list(pool.map(lambda batch: self._bulk_fetch(batch, fields_list), batches))
+
+        changed: List[Issue] = []
+        returned = set()
+        for page in pages:
+            for item in page:
+                returned.update(str(value) for value in (item.get("key"), item.get("id")) if value)
+                issue = self._to_issue(item)
+                if known_by_id.get(issue.id) != issue:
+                    changed.append(issue)
+        missing = [key for key in unique_keys if key not in returned]
+        return changed, missing
+
+    def _bulk_fetch(self, keys: List[str], fields: List[str]) -> List[dict]:
+        url = f"{self.base_url}/rest/api/3/issue/bulkfetch"
         response = requests.post(
             url,
-            json=payload,
+            json={"issueIdsOrKeys": keys, "fields": fields},
             auth=self.auth,
             verify=self.verify_ssl,
             timeout=self.timeout,
@@ -78,14 +155,79 @@ class JiraClient(BaseClient):
                 "Content-Type": "application/json",
             },
         )
-        print(response.json())
-
         response.raise_for_status()
+        data = response.json() or {}
+        # Keys that no longer exist or are not visible are listed in issueErrors
+        # instead; callers detect them as requested keys missing from the result.
+        return data.get("issues", [])
 
-        data = response.json()
+    def plan_query(self, jql: Optional[str] = None, **filters) -> Optional[JqlQuery]:
+        """Canonical query for a custom JQL string or filter set (None if unsupported)."""
+        return JqlQuery.parse(jql or self._build_jql(**filters))
 
-        for item in data.get("issues", []):
-            yield self._to_issue(item)
+    def _search_split(
+            self,
+            query: JqlQuery,
+            sub_queries: List[JqlQuery],
+            fields: List[str],
+            max_results: int,
+    ) -> List[dict]:
+        """Run the sub-queries of a split query in parallel and merge their pages."""
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sub_queries))) as pool:
+            pages = list(pool.map(lambda q: self._search(q.to_jql(), fields, max_results), sub_queries))
+
+        merged = {}
+        for page in pages:
+            for item in page:
+                merged.setdefault(item.get("key") or item.get("id"), item)
+        items = list(merged.values())
+
+        sort_field, descending = query.sort_key()
+        if sort_field == "updated":
+            epoch = datetime.min.replace(tzinfo=timezone.utc)
+            items.sort(
+                key=lambda item: _parse_timestamp((item.get("fields") or {}).get("updated")) or epoch,
+                reverse=descending,
+            )
+        return items[:max_results]
+
+    def _search(self, jql: str, fields: List[str], max_results: int) -> List[dict]:
+        url = f"{self.base_url}/rest/api/3/search/jql"
+
+        issues: List[dict] = []
+        next_page: Optional[str] = None
+        # Jira caps the page size, so larger requests follow nextPageToken.
+        while True:
+            payload = {
+                "jql": jql,
+                "fields": fields,
+                "maxResults": max_results - len(issues),
+            }
+            if next_page:
+                payload["nextPageToken"] = next_page
+
+            print(url, payload)
+            response = requests.post(
+                url,
+                json=payload,
+                auth=self.auth,
+                verify=self.verify_ssl,
+                timeout=self.timeout,
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+            )
+            print(response.json())
+
+            response.raise_for_status()
+
+            data = response.json()
+            page = data.get("issues", [])
+            issues.extend(page)
+            next_page = data.get("nextPageToken")
+            if not page or not next_page or len(issues) >= max_results:
+                return issues[:max_results]
 
     def fetch_projects(self) -> List[str]:
         url = f"{self.base_url}/rest/api/3/project/search"
@@ -176,6 +318,53 @@ class JiraClient(BaseClient):
         data = response.json() or {}
         return [label for label in data.get("values", []) if label]
 
+    def fetch_all_assignees(self, page_size: int = 1000) -> List[str]:
+        url = f"{self.base_url}/rest/api/3/users/search"
+        names = set()
+        start_at = 0
+        while True:
+            response = requests.get(
+                url,
+                params={"startAt": start_at, "maxResults": page_size},
+                auth=self.auth,
+                verify=self.verify_ssl,
+                timeout=self.timeout,
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+            data = response.json() or []
+            for user in data:
+                # Skip app/bot accounts and deactivated users.
+                if user.get("accountType", "atlassian") != "atlassian" or user.get("active") is False:
+                    continue
+                if user.get("displayName"):
+                    names.add(user["displayName"])
+            # Jira may cap the page below page_size, so only an empty page ends the list.
+            if not data:
+                return sorted(names)
+            start_at += len(data)
+
+    def fetch_all_labels(self, page_size: int = 1000) -> List[str]:
+        url = f"{self.base_url}/rest/api/3/label"
+        labels: List[str] = []
+        start_at = 0
+        while True:
+            response = requests.get(
+                url,
+                params={"startAt": start_at, "maxResults": page_size},
+                auth=self.auth,
+                verify=self.verify_ssl,
+                timeout=self.timeout,
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+            data = response.json() or {}
+            values = [label for label in data.get("values", []) if label]
+            labels.extend(values)
+            if data.get("isLast", True) or not values:
+                return sorted(set(labels))
+            start_at += len(values)
+
     def _build_jql(
             self,
             project_keys: Optional[List[str]] = None,
@@ -185,46 +374,19 @@ class JiraClient(BaseClient):
             labels: Optional[List[str]] = None,
             text_search: Optional[str] = None,
     ) -> str:
-        conditions: List[str] = []
-
-        if project_keys:
-            clean_keys = [k for k in project_keys if k]
-            if clean_keys:
-                keys = ",".join(clean_keys)
-                conditions.append(f"project IN ({keys})")
-
-        if statuses:
-            clean = [s for s in statuses if s]
-            if clean:
-                quoted = ",".join(f'"{s}"' for s in clean)
-                conditions.append(f"status IN ({quoted})")
-
-        if priorities:
-            clean = [p for p in priorities if p]
-            if clean:
-                quoted = ",".join(f'"{p}"' for p in clean)
-                conditions.append(f"priority IN ({quoted})")
-
-        if assignees:
-            clean = [a for a in assignees if a]
-            if clean:
-                quoted = ",".join(f'"{a}"' for a in clean)
-                conditions.append(f"assignee IN ({quoted})")
-
-        if labels:
-            clean = [l for l in labels if l]
-            if clean:
-                quoted = ",".join(f'"{l}"' for l in clean)
-                conditions.append(f"labels IN ({quoted})")
-
+        query = JqlQuery.from_filters(
+            {
+                "project": project_keys,
+                "status": statuses,
+                "priority": priorities,
+                "assignee": assignees,
+                "labels": labels,
+            }
+        )
         if text_search:
-            safe_text = text_search.replace('"', '\\"')
-            conditions.append(f'text ~ "{safe_text}"')
+            query = query.with_clause("text", "~", [text_search])
 
-        if not conditions:
-            conditions.append("updated >= -30d")
-
-        return " AND ".join(conditions) + " ORDER BY updated DESC"
+        return query.to_jql(default_condition="updated >= -30d")
 
     @staticmethod
     def _to_issue(item: dict) -> Issue:
@@ -233,6 +395,10 @@ class JiraClient(BaseClient):
         priority_name = (fields.get("priority") or {}).get("name") or "Medium"
         status_name = (fields.get("status") or {}).get("name") or "Unknown"
         assignee = (fields.get("assignee") or {}).get("displayName")
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        parent_id = (fields.get("parent") or {}).get("key")
+        labels = [label for label in fields.get("labels") or [] if label]
+        blocked_by, blocks = _blocking_links(fields.get("issuelinks") or [])
 
         is_blocker = (
                 priority_name.lower() in {"blocker", "critical"}
@@ -246,4 +412,53 @@ class JiraClient(BaseClient):
             priority=priority_name,
             assignee=assignee,
             is_blocker=is_blocker,
+            issue_type=issue_type,
+            parent_id=parent_id,
+            labels=labels,
+            blocked_by=blocked_by,
+            blocks=blocks,
+            description=_adf_to_text(fields.get("description")) or None,
+            updated=_parse_timestamp(fields.get("updated")),
         )
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    # Jira sends e.g. 2024-05-01T10:15:30.123+0000
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _blocking_links(links: List[dict]) -> Tuple[List[str], List[str]]:
+    """Split "Blocks"-type issue links into (blocked_by, blocks) keys."""
+    blocked_by: List[str] = []
+    blocks: List[str] = []
+    for link in links:
+        link_type = link.get("type") or {}
+        if (link_type.get("name") or "").lower() != "blocks" and "block" not in (link_type.get("outward") or "").lower():
+            continue
+        if (link.get("inwardIssue") or {}).get("key"):
+            blocked_by.append(link["inwardIssue"]["key"])
+        if (link.get("outwardIssue") or {}).get("key"):
+            blocks.append(link["outwardIssue"]["key"])
+    return blocked_by, blocks
+
+
+def _adf_to_text(node: object) -> str:
+    """Flatten an Atlassian Document Format body (or a plain string) to text."""
+    if not node:
+        return ""
+    if isinstance(node, str):
+        return node
+    if isinstance(node, list):
+        return " ".join(filter(None, (_adf_to_text(child) for child in node)))
+    if isinstance(node, dict):
+        if node.get("type") == "text":
+            return node.get("text") or ""
+        return _adf_to_text(node.get("content"))
+    return ""
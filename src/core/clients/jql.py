@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import itertools
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from src.models.issue import Issue
+
+MAX_IN_VALUES = 100
+
+_TOKEN = re.compile(
+    r'\s*(?:(?P<quoted>"(?:[^"\\]|\\.)*")|(?P<op>>=|<=|!=|[=~<>(),])|(?P<word>[^\s(),=~<>!"]+))'
+)
+_COMPARISONS = {"=", "!=", "~", ">=", "<=", ">", "<"}
+# Words JQL treats specially; bare they change meaning, so such queries are left alone.
+_RESERVED = {"and", "or", "not", "in", "is", "was", "empty", "null", "order", "by", "changed"}
+_BARE_VALUE = re.compile(r"[A-Za-z0-9_]+|-?\d+[A-Za-z]?")
+
+_ISSUE_KEY = re.compile(r"[A-Za-z][A-Za-z0-9_]*-\d+")
+_PROJECT_KEY = re.compile(r"[A-Z][A-Z0-9_]*")
+# Atlassian account ids: legacy 24-hex ids and "<number>:<uuid>" ids.
+_ACCOUNT_ID = re.compile(r"[0-9a-f]{24}|\d+:[0-9a-f-]{36}", flags=re.IGNORECASE)
+
+
+def _is_name(value: str) -> bool:
+    # Jira also accepts numeric ids here; those cannot be matched against names.
+    return not value.isdigit()
+
+
+def _is_display_name(value: str) -> bool:
+    return _is_name(value) and "@" not in value and not _ACCOUNT_ID.fullmatch(value)
+
+
+# Fields that can be checked against an Issue without asking Jira, with a test that
+# a clause value is in the form the Issue holds (a key or name rather than an id).
+_LOCAL_FIELDS = {
+    "project": (lambda issue: [issue.id.split("-", 1)[0]], _PROJECT_KEY.fullmatch),
+    "key": (lambda issue: [issue.id], _ISSUE_KEY.fullmatch),
+    "issuekey": (lambda issue: [issue.id], _ISSUE_KEY.fullmatch),
+    "status": (lambda issue: [issue.status], _is_name),
+    "priority": (lambda issue: [issue.priority], _is_name),
+    "assignee": (lambda issue: [issue.assignee] if issue.assignee else [], _is_display_name),
+    "issuetype": (lambda issue: [issue.issue_type] if issue.issue_type else [], _is_name),
+    "type": (lambda issue: [issue.issue_type] if issue.issue_type else [], _is_name),
+    "parent": (lambda issue: [issue.parent_id] if issue.parent_id else [], _ISSUE_KEY.fullmatch),
+    "labels": (lambda issue: list(issue.labels), lambda value: True),
+}
+
+Clause = Tuple[str, str, Tuple[str, ...]]
+
+
+class JqlQuery:
+    """
+    Canonical form of a conjunctive JQL query (clauses joined by AND).
+
+    ``field = value`` becomes a one-value IN list, IN values are de-duplicated and
+    sorted, and clauses are ordered by field, so logically identical filters
+    produce the same string. Field names are kept as written; clauses on the same
+    field are never merged, since fields such as labels hold several values.
+    """
+
+    def __init__(self, clauses: Iterable[Clause] = (), order_by: str = "") -> None:
+        canonical = {
+            (field, "in" if op.lower() in {"=", "in"} else op, tuple(sorted(set(values))))
+            for field, op, values in clauses
+        }
+        self.clauses: List[Clause] = sorted(canonical, key=lambda c: (_field_key(c[0]), c[1], c[2], c[0]))
+        self.order_by = re.sub(
+            r"\b(asc|desc)\b", lambda m: m.group(0).upper(), " ".join(order_by.split()), flags=re.IGNORECASE
+        )
+
+    @classmethod
+    def parse(cls, jql: str) -> Optional["JqlQuery"]:
+        """Parse supported JQL; returns None for OR, NOT, nesting or functions."""
+        body, order_by = _split_order_by(jql or "")
+        tokens = _tokenize(body)
+        if tokens is None:
+            return None
+
+        clauses: List[Clause] = []
+        pos = 0
+        while pos < len(tokens):
+            if clauses:
+                if tokens[pos].upper() != "AND":
+                    return None
+                pos += 1
+            if pos + 1 >= len(tokens):
+                return None
+            field, op = tokens[pos], tokens[pos + 1]
+            if field in {"(", ")", ","} or field.lower() in _RESERVED:
+                return None
+            if op.upper() == "IN":
+                values, pos = _parse_list(tokens, pos + 2)
+                if not values:
+                    return None
+                clauses.append((field, "in", tuple(values)))
+            elif op in _COMPARISONS and pos + 2 < len(tokens):
+                value = tokens[pos + 2]
+                if value in {"(", ")", ","} or value.lower() in _RESERVED:
+                    return None
+                if pos + 3 < len(tokens) and tokens[pos + 3] == "(":
+                    return None
+                clauses.append((field, op, (_unquote(value),)))
+                pos += 3
+            else:
+                return None
+        return cls(clauses, order_by)
+
+    @classmethod
+    def from_filters(cls, filters: Dict[str, Optional[List[str]]], order_by: str = "updated DESC") -> "JqlQuery":
+        clauses = [
+            (field, "in", tuple(v for v in values if v))
+            for field, values in filters.items()
+            if values and any(values)
+        ]
+        return cls(clauses, order_by)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, JqlQuery) and self.to_jql() == other.to_jql()
+
+    def __hash__(self) -> int:
+        return hash(self.to_jql())
+
+    def __repr__(self) -> str:
+        return f"JqlQuery({self.to_jql()!r})"
+
+    def with_clause(self, field: str, op: str, values: Iterable[str]) -> "JqlQuery":
+        return JqlQuery(self.clauses + [(field, op, tuple(values))], self.order_by)
+
+    def to_jql(self, default_condition: str = "") -> str:
+        parts = []
+        for field, op, values in self.clauses:
+            if op == "in":
+                parts.append(f"{field} IN ({', '.join(_quote(v) for v in values)})")
+            else:
+                parts.append(f"{field} {op} {_quote(values[0])}")
+        where = " AND ".join(parts) or default_condition
+        order = f"ORDER BY {self.order_by}" if self.order_by else ""
+        return " ".join(p for p in (where, order) if p)
+
+    def sort_key(self) -> Tuple[str, bool]:
+        """First ORDER BY field (lower-cased) and whether it sorts descending."""
+        first = self.order_by.split(",", 1)[0].split()
+        if not first:
+            return "", False
+        return _field_key(first[0]), len(first) > 1 and first[1].upper() == "DESC"
+
+    def split(self, max_in_values: int = MAX_IN_VALUES) -> List["JqlQuery"]:
+        """
+        Break oversized IN lists into chunks. The union of the sub-queries' results
+        is exactly this query's result; multi-valued fields can put one issue in
+        several sub-queries, so callers de-duplicate.
+        """
+        chunked = []
+        for field, op, values in self.clauses:
+            if op == "in" and len(values) > max_in_values:
+                chunks = [values[i:i + max_in_values] for i in range(0, len(values), max_in_values)]
+            else:
+                chunks = [values]
+            chunked.append([(field, op, chunk) for chunk in chunks])
+
+        queries = [JqlQuery(combo, self.order_by) for combo in itertools.product(*chunked)]
+        return queries if len(queries) > 1 else [self]
+
+    def is_subset_of(self, other: "JqlQuery") -> bool:
+        """True if every issue matching this query also matches ``other``."""
+        return all(
+            any(_implies(mine, theirs) for mine in self.clauses)
+            for theirs in other.clauses
+        )
+
+    def locally_evaluable(self, relative_to: Optional["JqlQuery"] = None) -> bool:
+        """Whether ``matches`` can decide the clauses not already in ``relative_to``."""
+        shared = {_clause_key(c) for c in relative_to.clauses} if relative_to is not None else set()
+        return all(_clause_key(clause) in shared or _is_local(clause) for clause in self.clauses)
+
+    def local_part(self) -> "JqlQuery":
+        """The clauses ``matches`` can decide, as a query of their own."""
+        return JqlQuery([clause for clause in self.clauses if _is_local(clause)], self.order_by)
+
+    def filter(self, issues: Iterable[Issue]) -> List[Issue]:
+        """
+        Issues matching this query, evaluated locally. Raises ValueError if any
+        clause needs Jira to evaluate it.
+        """
+        if not self.locally_evaluable():
+            raise ValueError(
+                f"'{self.to_jql()}' cannot be evaluated locally; only =, != and IN clauses on "
+                f"{', '.join(sorted(_LOCAL_FIELDS))} using keys or names are supported"
+            )
+        return [issue for issue in issues if self.matches(issue)]
+
+    def matches(self, issue: Issue) -> bool:
+        """Evaluate the locally decidable clauses; other clauses are assumed to hold."""
+        for clause in self.clauses:
+            if not _is_local(clause):
+                continue
+            field, op, values = clause
+            getter = _LOCAL_FIELDS[_field_key(field)][0]
+            actual = [v.lower() for v in getter(issue)]
+            wanted = {v.lower() for v in values}
+            found = any(v in wanted for v in actual)
+            # Like Jira, "!=" never matches an empty field.
+            if op == "in" and not found or op == "!=" and (found or not actual):
+                return False
+        return True
+
+
+class QueryResultCache:
+    """
+    Bounded LRU of search results keyed by canonical JQL.
+
+    A miss can still be served from a cached superset query when that result was
+    complete (fewer hits than its page size) and the extra clauses can be checked
+    locally against the cached issues. Entries expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, max_entries: int = 32, ttl: float = 300) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[JqlQuery, List[Issue], bool, float]]" = OrderedDict()
+
+    def get(self, query: JqlQuery, max_results: int) -> Optional[List[Issue]]:
+        self._expire()
+        key = (query.to_jql(), max_results)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+
+        for cached_query, issues, complete, _ in reversed(self._entries.values()):
+            if (
+                    complete
+                    and cached_query.order_by == query.order_by
+                    and query.is_subset_of(cached_query)
+                    and query.locally_evaluable(relative_to=cached_query)
+            ):
+                return [issue for issue in issues if query.matches(issue)][:max_results]
+        return None
+
+    def put(self, query: JqlQuery, max_results: int, issues: List[Issue]) -> None:
+        key = (query.to_jql(), max_results)
+        self._entries[key] = (query, issues, len(issues) < max_results, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl
+        for key in [k for k, entry in self._entries.items() if entry[3] < cutoff]:
+            del self._entries[key]
+
+
+def _split_order_by(jql: str) -> Tuple[str, str]:
+    match = re.search(r"\border\s+by\b", jql, flags=re.IGNORECASE)
+    if not match:
+        return jql.strip(), ""
+    return jql[:match.start()].strip(), jql[match.end():].strip()
+
+
+def _tokenize(text: str) -> Optional[List[str]]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match:
+            return None
+        tokens.append(match.group(match.lastgroup))
+        pos = match.end()
+    return tokens
+
+
+def _parse_list(tokens: List[str], pos: int) -> Tuple[Optional[List[str]], int]:
+    if pos >= len(tokens) or tokens[pos] != "(":
+        return None, pos
+    values: List[str] = []
+    pos += 1
+    while pos < len(tokens):
+        token = tokens[pos]
+        if token == ")":
+            return values, pos + 1
+        if token == ",":
+            pos += 1
+            continue
+        if token == "(" or token.lower() in _RESERVED or (pos + 1 < len(tokens) and tokens[pos + 1] == "("):
+            return None, pos
+        values.append(_unquote(token))
+        pos += 1
+    return None, pos
+
+
+def _field_key(field: str) -> str:
+    return _unquote(field).lower()
+
+
+def _clause_key(clause: Clause) -> Clause:
+    return _field_key(clause[0]), clause[1], clause[2]
+
+
+def _is_local(clause: Clause) -> bool:
+    field, op, values = clause
+    local = _LOCAL_FIELDS.get(_field_key(field))
+    return local is not None and op in {"in", "!="} and all(local[1](value) for value in values)
+
+
+def _implies(mine: Clause, theirs: Clause) -> bool:
+    """Whether an issue matching clause ``mine`` always matches ``theirs``."""
+    field, op, values = _clause_key(mine)
+    other_field, other_op, other_values = _clause_key(theirs)
+    if field != other_field or op != other_op:
+        return False
+    if op == "in":
+        return set(values) <= set(other_values)
+    return values == other_values
+
+
+def _unquote(token: str) -> str:
+    if len(token) >= 2 and token[0] == token[-1] == '"':
+        return re.sub(r"\\(.)", r"\1", token[1:-1])
+    return token
+
+
+def _quote(value: str) -> str:
+    if _BARE_VALUE.fullmatch(value) and value.lower() not in _RESERVED:
+        return value
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
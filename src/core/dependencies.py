@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.hierarchy import is_done
+from src.models.issue import Issue
+
+
+class DependencyGraph:
+    """
+    "Blocks" links between issues as an integer adjacency index.
+
+    Edges point from blocker to blocked issue and live while either end reports
+    them. Edits touch only the changed issue's edges; the strongly connected
+    components and longest blocker chains are rebuilt lazily, in linear time, the
+    next time they are queried. Done issues (and links touching them) no longer
+    block anything.
+    """
+
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._out: List[Set[int]] = []
+        self._in: List[Set[int]] = []
+        self._open: List[bool] = []
+        self._reported: Dict[int, Set[Tuple[int, int]]] = {}
+        self._refs: Dict[Tuple[int, int], int] = {}
+        self._analysis: Optional[Tuple[List[int], List[List[int]], List[int], List[int]]] = None
+        self.update(issues)
+
+    def update(self, issues: Iterable[Issue]) -> None:
+        """Replace the links each issue reported before with the ones it reports now."""
+        for issue in issues:
+            node = self._node(issue.id)
+            self._open[node] = not is_done(issue)
+            edges = {(self._node(blocker), node) for blocker in issue.blocked_by if blocker != issue.id}
+            edges |= {(node, self._node(blocked)) for blocked in issue.blocks if blocked != issue.id}
+            previous = self._reported.get(node, set())
+            for edge in previous - edges:
+                self._release(edge)
+            for edge in edges - previous:
+                self._retain(edge)
+            self._reported[node] = edges
+        self._analysis = None
+
+    def remove(self, issue_ids: Iterable[str]) -> None:
+        """Forget what deleted issues reported; links the other end reports remain."""
+        for issue_id in issue_ids:
+            node = self._index.get(issue_id)
+            if node is None:
+                continue
+            for edge in self._reported.pop(node, set()):
+                self._release(edge)
+            # Still-linked ids look like issues outside the batch again: assumed open.
+            self._open[node] = True
+        self._analysis = None
+
+    def blocked_counts(self) -> Dict[str, int]:
+        """
+        How many open issues each known issue holds up transitively, for all at once.
+
+        Reachability is propagated as bitsets over the components in reverse
+        topological order, and a component's set is freed once all its
+        predecessors have used it.
+        """
+        component_of, components, _, _ = self._analyze()
+        pending = [0] * len(components)
+        for position, component in enumerate(components):
+            for node in component:
+                for other in self._active(self._out, node):
+                    if component_of[other] != position:
+                        pending[component_of[other]] += 1
+
+        closure: Dict[int, int] = {}
+        counts: Dict[str, int] = {}
+        for position in reversed(range(len(components))):
+            component = components[position]
+            bits = 0
+            for node in component:
+                if self._open[node]:
+                    bits |= 1 << node
+            for node in component:
+                for other in self._active(self._out, node):
+                    target = component_of[other]
+                    if target == position:
+                        continue
+                    bits |= closure[target]
+                    pending[target] -= 1
+                    if not pending[target]:
+                        del closure[target]
+            if pending[position]:
+                closure[position] = bits
+            reach = bits.bit_count() - 1
+            for node in component:
+                # Ids only seen as link targets (or deleted) are not reported.
+                if node in self._reported:
+                    counts[self._ids[node]] = reach if self._open[node] else 0
+        return counts
+
+    def cycles(self) -> List[List[str]]:
+        """Groups of open issues that block each other in a loop."""
+        _, components, _, _ = self._analyze()
+        return sorted(
+            sorted(self._ids[node] for node in component)
+            for component in components
+            if len(component) > 1
+        )
+
+    def critical_path(self, targets: Iterable[str]) -> List[str]:
+        """Longest chain of open blockers ending at one of ``targets``, blocker first."""
+        component_of, components, length, previous = self._analyze()
+        best: Optional[int] = None
+        for issue_id in targets:
+            node = self._index.get(issue_id)
+            if node is None or not self._open[node]:
+                continue
+            component = component_of[node]
+            if best is None or length[component] > length[best]:
+                best = component
+
+        chain: List[str] = []
+        while best is not None and best != -1:
+            chain.extend(sorted(self._ids[node] for node in components[best] if self._open[node]))
+            best = previous[best]
+        return list(reversed(chain))
+
+    def _node(self, issue_id: str) -> int:
+        node = self._index.get(issue_id)
+        if node is None:
+            node = self._index[issue_id] = len(self._ids)
+            self._ids.append(issue_id)
+            self._out.append(set())
+            self._in.append(set())
+            # Linked issues outside the fetched batch are assumed open.
+            self._open.append(True)
+        return node
+
+    def _retain(self, edge: Tuple[int, int]) -> None:
+        self._refs[edge] = self._refs.get(edge, 0) + 1
+        source, target = edge
+        self._out[source].add(target)
+        self._in[target].add(source)
+
+    def _release(self, edge: Tuple[int, int]) -> None:
+        refs = self._refs.get(edge, 0) - 1
+        if refs > 0:
+            self._refs[edge] = refs
+            return
+        self._refs.pop(edge, None)
+        source, target = edge
+        self._out[source].discard(target)
+        self._in[target].discard(source)
+
+    def _active(self, adjacency: List[Set[int]], node: int) -> Iterable[int]:
+        if not self._open[node]:
+            return ()
+        return (other for other in adjacency[node] if self._open[other])
+
+    def _analyze(self) -> Tuple[List[int], List[List[int]], List[int], List[int]]:
+        if self._analysis is None:
+            component_of, components = self._components()
+            length, previous = self._longest_chains(component_of, components)
+            self._analysis = (component_of, components, length, previous)
+        return self._analysis
+
+    def _components(self) -> Tuple[List[int], List[List[int]]]:
+        """Iterative Tarjan SCC; components come out in topological order."""
+        count = len(self._ids)
+        order = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(self._active(self._out, root)))]
+            while work:
+                node, successors = work[-1]
+                for other in successors:
+                    if order[other] == -1:
+                        order[other] = low[other] = counter
+                        counter += 1
+                        stack.append(other)
+                        on_stack[other] = True
+                        work.append((other, iter(self._active(self._out, other))))
+                        break
+                    if on_stack[other]:
+                        low[node] = min(low[node], order[other])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == order[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+        # Tarjan emits sinks first.
+        components.reverse()
+        component_of = [0] * count
+        for position, component in enumerate(components):
+            for node in component:
+                component_of[node] = position
+        return component_of, components
+
+    def _longest_chains(
+            self,
+            component_of: List[int],
+            components: List[List[int]],
+    ) -> Tuple[List[int], List[int]]:
+        """Open issues on the longest blocker chain ending in each component."""
+        best_in = [0] * len(components)
+        previous = [-1] * len(components)
+        length = [0] * len(components)
+        for position, component in enumerate(components):
+            length[position] = best_in[position] + sum(1 for node in component if self._open[node])
+            for node in component:
+                for other in self._active(self._out, node):
+                    target = component_of[other]
+                    if target != position and length[position] > best_in[target]:
+                        best_in[target] = length[position]
+                        previous[target] = position
+        return length, previous
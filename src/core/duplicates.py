@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import random
+import re
+import zlib
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.issue import Issue
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.6
+# Buckets of common title templates stop taking new clusters past this size.
+MAX_BUCKET_SIZE = 8
+# Clusters sharing the most bands with an issue are verified, best first.
+MAX_CANDIDATES = 3
+_MAX_CACHED_SHINGLES = 8192
+# Persisted signatures kept, least recently used dropped first.
+MAX_STORED_SIGNATURES = 50_000
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Fixed seed so persisted signatures stay comparable across runs.
+_rng = random.Random(20240601)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_PARAMS = f"k{SHINGLE_SIZE}-p{NUM_PERM}"
+# Permuted hashes per shingle; titles share most of their shingles.
+_shingle_rows: Dict[int, Tuple[int, ...]] = {}
+
+
+def normalize_title(title: str) -> str:
+    return " ".join(re.findall(r"\w+", title.lower()))
+
+
+def shingles(text: str) -> Set[int]:
+    """Hash character k-shingles of normalized text (stable across processes)."""
+    if len(text) <= SHINGLE_SIZE:
+        return {zlib.crc32(text.encode("utf-8"))}
+    return {
+        zlib.crc32(text[i:i + SHINGLE_SIZE].encode("utf-8"))
+        for i in range(len(text) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(text: str) -> List[int]:
+    rows = []
+    for shingle in shingles(text):
+        row = _shingle_rows.get(shingle)
+        if row is None:
+            if len(_shingle_rows) >= _MAX_CACHED_SHINGLES:
+                _shingle_rows.clear()
+            row = _shingle_rows[shingle] = tuple((a * shingle + b) % _PRIME for a, b in _PERMUTATIONS)
+        rows.append(row)
+    return [value & _MAX_HASH for value in map(min, zip(*rows))]
+
+
+def estimate_similarity(left: List[int], right: List[int]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / NUM_PERM
+
+
+class SignatureStore:
+    """
+    MinHash signatures keyed by issue id, re-hashed only when a title changes.
+
+    Entries are kept in least-recently-used order and the oldest are dropped on
+    save beyond ``max_entries``, so issues no report looks at any more age out.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = MAX_STORED_SIGNATURES) -> None:
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self._signatures: Dict[str, Tuple[int, List[int]]] = {}
+        self._dirty = False
+        self._load()
+
+    def signature(self, issue: Issue) -> Optional[List[int]]:
+        text = normalize_title(issue.title)
+        if not text:
+            return None
+        fingerprint = zlib.crc32(text.encode("utf-8"))
+        cached = self._signatures.pop(issue.id, None)
+        if cached and cached[0] == fingerprint:
+            # Re-insert to mark it recently used.
+            self._signatures[issue.id] = cached
+            return cached[1]
+        signature = minhash(text)
+        self._signatures[issue.id] = (fingerprint, signature)
+        self._dirty = True
+        return signature
+
+    def discard(self, issue_ids: Iterable[str]) -> None:
+        for issue_id in issue_ids:
+            if self._signatures.pop(issue_id, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        for issue_id in list(self._signatures)[:max(0, len(self._signatures) - self.max_entries)]:
+            del self._signatures[issue_id]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "params": _PARAMS,
+            "signatures": {k: [fp, sig] for k, (fp, sig) in self._signatures.items()},
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(self.path)
+        self._dirty = False
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("params") != _PARAMS:
+            return
+        self._signatures = {
+            k: (fp, sig) for k, (fp, sig) in data.get("signatures", {}).items()
+        }
+
+
+def find_duplicates(
+        issues: Iterable[Issue],
+        store: Optional[SignatureStore] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+) -> List[List[Issue]]:
+    """
+    Group issues with near-identical titles using MinHash + LSH banding.
+
+    Each cluster is represented by its first issue (in key order), and an issue
+    joins a cluster only when it is similar to that representative, so chains of
+    slightly different titles do not merge into one group. Band buckets hold
+    representatives only and are capped, so each issue is checked against a
+    bounded number of candidates.
+    """
+    store = store or SignatureStore()
+    signatures: Dict[str, List[int]] = {}
+    leader_of: Dict[str, str] = {}
+    by_signature: Dict[Tuple[int, ...], str] = {}
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+    groups: Dict[str, List[Issue]] = defaultdict(list)
+
+    for issue in sorted(issues, key=lambda item: item.id):
+        signature = store.signature(issue)
+        if signature is None:
+            continue
+        key = tuple(signature)
+        if key in by_signature:
+            leader = leader_of[by_signature[key]]
+        else:
+            by_signature[key] = issue.id
+            signatures[issue.id] = signature
+            band_keys = [(band, key[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+            hits: Counter = Counter()
+            for band_key in band_keys:
+                hits.update(buckets.get(band_key, ()))
+            leader = next(
+                (
+                    candidate
+                    for candidate, _ in hits.most_common(MAX_CANDIDATES)
+                    if estimate_similarity(signature, signatures[candidate]) >= threshold
+                ),
+                issue.id,
+            )
+            if leader == issue.id:
+                for band_key in band_keys:
+                    members = buckets[band_key]
+                    if len(members) < MAX_BUCKET_SIZE:
+                        members.append(issue.id)
+        leader_of[issue.id] = leader
+        groups[leader].append(issue)
+
+    clusters = [group for group in groups.values() if len(group) > 1]
+    return sorted(clusters, key=lambda g: (-len(g), g[0].id))
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.models.issue import Issue
+
+DONE_STATUSES = {"done", "closed", "resolved"}
+
+
+def is_done(issue: Issue) -> bool:
+    return issue.status.lower() in DONE_STATUSES
+
+
+class HierarchyIndex:
+    """
+    Parent -> children index over epic -> story -> sub-task with bottom-up roll-ups.
+
+    Leaves count as one unit of work; parents aggregate their children. Updates only
+    recompute the touched issues and their ancestors, so small changes stay cheap on
+    large programs.
+    """
+
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        self._issues: Dict[str, Issue] = {}
+        self._children: Dict[str, Set[str]] = defaultdict(set)
+        self._total: Dict[str, int] = {}
+        self._done: Dict[str, int] = {}
+        self._blockers: Dict[str, int] = {}
+        self.update(issues)
+
+    def update(self, issues: Iterable[Issue]) -> None:
+        """Insert or replace issues and refresh the affected roll-ups."""
+        dirty: Set[str] = set()
+        for issue in issues:
+            old = self._issues.get(issue.id)
+            if old is not None and old.parent_id != issue.parent_id:
+                dirty.update(self._ancestors(issue.id))
+                if old.parent_id:
+                    self._unlink(old.parent_id, issue.id)
+            self._issues[issue.id] = issue
+            if issue.parent_id:
+                self._children[issue.parent_id].add(issue.id)
+            dirty.add(issue.id)
+            dirty.update(self._ancestors(issue.id))
+        self._recompute(dirty)
+
+    def remove(self, issue_ids: Iterable[str]) -> None:
+        """Drop issues from the index and refresh the affected roll-ups."""
+        dirty: Set[str] = set()
+        for issue_id in issue_ids:
+            old = self._issues.get(issue_id)
+            if old is None:
+                continue
+            dirty.update(self._ancestors(issue_id))
+            if old.parent_id:
+                self._unlink(old.parent_id, issue_id)
+            del self._issues[issue_id]
+            # Children keep pointing here; the id stays as a placeholder parent.
+            dirty.add(issue_id)
+        self._recompute(dirty)
+
+    def rollup(self, issue_id: str) -> Optional[Dict[str, object]]:
+        """Return completion metrics for one issue's subtree."""
+        if issue_id not in self._total:
+            return None
+        return self._rollup(issue_id, self._remaining_total())
+
+    def root_of(self, issue_id: str) -> str:
+        """Top-level ancestor of an issue (the issue itself when it has no parent)."""
+        chain = self._ancestors(issue_id)
+        return chain[-1] if chain else issue_id
+
+    def epics(self) -> List[Dict[str, object]]:
+        """Roll-ups for top-level parents (normally epics), highest focus first."""
+        remaining_total = self._remaining_total()
+        tops = [
+            self._rollup(node, remaining_total)
+            for node in self._children
+            if self._children[node] and self._parent(node) is None
+        ]
+        return sorted(tops, key=lambda r: (-r["focus"], r["id"]))
+
+    def _rollup(self, node: str, remaining_total: int) -> Dict[str, object]:
+        issue = self._issues.get(node)
+        total = self._total[node]
+        done = self._done[node]
+        remaining = total - done
+        return {
+            "id": node,
+            "title": issue.title if issue else "",
+            "issue_type": issue.issue_type if issue else None,
+            "total": total,
+            "done": done,
+            "remaining": remaining,
+            "completion": round(100.0 * done / total, 1) if total else 0.0,
+            "blockers": self._blockers[node],
+            "focus": round(remaining / remaining_total, 3) if remaining_total else 0.0,
+        }
+
+    def _remaining_total(self) -> int:
+        return sum(
+            self._total[node] - self._done[node]
+            for node in self._total
+            if self._parent(node) is None
+        )
+
+    def _parent(self, node: str) -> Optional[str]:
+        issue = self._issues.get(node)
+        return issue.parent_id if issue else None
+
+    def _ancestors(self, node: str) -> List[str]:
+        chain: List[str] = []
+        seen = {node}
+        parent = self._parent(node)
+        while parent and parent not in seen:
+            chain.append(parent)
+            seen.add(parent)
+            parent = self._parent(parent)
+        return chain
+
+    def _unlink(self, parent: str, child: str) -> None:
+        siblings = self._children.get(parent)
+        if siblings is not None:
+            siblings.discard(child)
+            if not siblings:
+                del self._children[parent]
+
+    def _depths(self, nodes: Iterable[str]) -> Dict[str, int]:
+        depths: Dict[str, int] = {}
+        for start in nodes:
+            path: List[str] = []
+            on_path: Set[str] = set()
+            node: Optional[str] = start
+            while node is not None and node not in depths and node not in on_path:
+                path.append(node)
+                on_path.add(node)
+                node = self._parent(node)
+            # A parent cycle (bad data) is cut by treating its entry point as a root.
+            base = depths[node] + 1 if node is not None and node in depths else 0
+            for offset, item in enumerate(reversed(path)):
+                depths[item] = base + offset
+        return depths
+
+    def _recompute(self, dirty: Set[str]) -> None:
+        if not dirty:
+            return
+        depths = self._depths(dirty)
+        buckets: Dict[int, List[str]] = defaultdict(list)
+        for node in dirty:
+            buckets[depths[node]].append(node)
+
+        for depth in sorted(buckets, reverse=True):
+            for node in buckets[depth]:
+                self._recompute_node(node)
+
+    def _recompute_node(self, node: str) -> None:
+        issue = self._issues.get(node)
+        children = self._children.get(node)
+
+        if not children:
+            if issue is None:
+                self._total.pop(node, None)
+                self._done.pop(node, None)
+                self._blockers.pop(node, None)
+                return
+            self._total[node] = 1
+            self._done[node] = int(is_done(issue))
+            self._blockers[node] = int(_is_open_blocker(issue))
+            return
+
+        total = done = 0
+        blockers = int(issue is not None and _is_open_blocker(issue))
+        for child in children:
+            total += self._total.get(child, 0)
+            done += self._done.get(child, 0)
+            blockers += self._blockers.get(child, 0)
+        self._total[node] = total
+        self._done[node] = done
+        self._blockers[node] = blockers
+
+
+def _is_open_blocker(issue: Issue) -> bool:
+    return not is_done(issue) and (issue.is_blocker or issue.status.lower() == "blocked")
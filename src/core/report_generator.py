@@ -2,41 +2,115 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from src.config import get_settings
 from src.core.analyzer import analyze_issues, format_summary
 from src.core.clients.jira_client import JiraClient
+from src.core.clients.jql import JqlQuery
+from src.core.duplicates import SignatureStore, find_duplicates
+from src.core.search_index import SearchIndex
+from src.core.services.issue_store import STORE_FILENAME, IssueStore
 from src.models.issue import Issue
+from src.utils.profiler import StageProfiler
 
 
-def fetch_from_jira(settings: dict) -> Iterable[Issue]:
-    """Instantiate Jira client and fetch issues with optional default JQL."""
-    client = JiraClient(
+def _jira_client(settings: dict) -> JiraClient:
+    return JiraClient(
         base_url=settings["jira_base_url"],
         email=settings["jira_email"],
         api_token=settings["jira_api_token"],
         verify_ssl=settings["jira_verify_ssl"],
     )
-    return client.fetch_issues(jql=settings["jira_default_jql"])
 
 
-def run(jql: Optional[str] = None) -> Path:
-    """Generate a text report from Jira issues and return the output path."""
+def fetch_from_jira(settings: dict) -> Iterable[Issue]:
+    """Instantiate Jira client and fetch issues with optional default JQL."""
+    return _jira_client(settings).fetch_issues(jql=settings["jira_default_jql"])
+
+
+def load_from_store(settings: dict, jql: Optional[str] = None) -> List[Issue]:
+    """
+    Issues kept current by the webhook receiver (src/api/server.py), which seeds
+    and writes the store; reports only read it.
+
+    ``jql`` is evaluated locally against the stored issues; a ValueError is
+    raised if it uses clauses that only Jira can evaluate.
+    """
+    path = Path(settings["cache_output_dir"]) / STORE_FILENAME
+    if not path.exists():
+        raise ValueError("the issue store does not exist yet; start src/api/server.py, which seeds it")
+    issues = IssueStore(path).issues()
+    if not jql:
+        return issues
+
+    query = JqlQuery.parse(jql)
+    if query is None:
+        raise ValueError(f"'{jql}' cannot be evaluated against the issue store; run without --from-store")
+    return query.filter(issues)
+
+
+def run(
+        jql: Optional[str] = None,
+        text_search: Optional[str] = None,
+        from_store: bool = False,
+        profile: bool = False,
+) -> Tuple[Path, Optional[Tuple[Path, Path]]]:
+    """
+    Generate a text report from Jira issues.
+
+    ``text_search`` narrows the fetched issues with the local search index;
+    ``from_store`` reads the webhook-synced issue store instead of searching Jira;
+    ``profile`` writes per-stage CPU stacks and memory tables to the log directory.
+    Returns the report path and, when profiling, the (folded stacks, stage table) paths.
+    """
     settings = get_settings()
+    profiler = StageProfiler(settings["log_output_dir"], enabled=profile)
+    with profiler:
+        output_file = _generate(settings, jql, text_search, from_store, profiler)
+    return output_file, profiler.write() if profile else None
+
 
+def _generate(
+        settings: dict,
+        jql: Optional[str],
+        text_search: Optional[str],
+        from_store: bool,
+        profiler: StageProfiler,
+) -> Path:
     effective_settings = dict(settings)
     effective_settings["jira_default_jql"] = jql or settings.get("jira_default_jql")
 
-    issues = fetch_from_jira(effective_settings)
-    summary = analyze_issues(issues)
-    summary_text = format_summary(summary)
+    if from_store:
+        with profiler.stage("load_store"):
+            issues = load_from_store(settings, jql)
+    else:
+        with profiler.stage("fetch"):
+            raw_issues = _jira_client(effective_settings).fetch_raw_issues(
+                jql=effective_settings["jira_default_jql"]
+            )
+        with profiler.stage("map"):
+            issues = [JiraClient._to_issue(item) for item in raw_issues]
+    if text_search:
+        with profiler.stage("search"):
+            issues = SearchIndex(issues).filter(issues, text_search)
+
+    with profiler.stage("analyze"):
+        summary = analyze_issues(issues)
+
+    with profiler.stage("duplicates"):
+        signature_store = SignatureStore(Path(settings["cache_output_dir"]) / "title_signatures.json")
+        summary["duplicates"] = find_duplicates(issues, signature_store)
+        signature_store.save()
+
+    with profiler.stage("write"):
+        summary_text = format_summary(summary)
 
-    output_dir = Path(settings["summary_output_dir"])
-    output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = Path(settings["summary_output_dir"])
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    output_file = output_dir / f"report-{timestamp}.txt"
-    output_file.write_text(summary_text, encoding="utf-8")
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output_file = output_dir / f"report-{timestamp}.txt"
+        output_file.write_text(summary_text, encoding="utf-8")
 
     return output_file
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.issue import Issue
+
+FIELD_WEIGHTS = {"title": 2.0, "description": 1.0}
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    return re.findall(r"\w+", (text or "").lower())
+
+
+class SearchIndex:
+    """
+    Local inverted index over issue titles and descriptions.
+
+    Queries match every token (AND), including each part of a word such as
+    "log-in"; a word ending in ``*`` and, by default, the last word of the query
+    match as prefixes. Results are ranked with BM25.
+    """
+
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Set[str]] = {}
+        self._doc_len: Dict[str, float] = {}
+        self._doc_text: Dict[str, Tuple[str, str]] = {}
+        self._total_len = 0.0
+        self._vocab: List[str] = []
+        self._vocab_dirty = False
+        self.update(issues)
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def update(self, issues: Iterable[Issue]) -> None:
+        """Index new issues and re-index those whose text changed."""
+        for issue in issues:
+            text = (issue.title or "", issue.description or "")
+            if self._doc_text.get(issue.id) == text:
+                continue
+            self._remove(issue.id)
+            self._add(issue.id, text)
+
+    def remove(self, issue_ids: Iterable[str]) -> None:
+        for issue_id in issue_ids:
+            self._remove(issue_id)
+
+    def sync(self, issues: Iterable[Issue]) -> None:
+        """Make the index mirror exactly this batch, touching only what differs."""
+        issue_list = list(issues)
+        keep = {issue.id for issue in issue_list}
+        self.remove([issue_id for issue_id in self._doc_terms if issue_id not in keep])
+        self.update(issue_list)
+
+    def search(self, query: str, limit: Optional[int] = None, prefix_last: bool = True) -> List[str]:
+        """Return matching issue ids, best match first."""
+        raw_terms = (query or "").lower().split()
+        if not raw_terms or not self._doc_terms:
+            return []
+
+        # Words such as "log-in" split into several tokens; each one must match.
+        terms: List[Tuple[str, bool]] = []
+        for position, raw in enumerate(raw_terms):
+            wants_prefix = raw.endswith("*") or (prefix_last and position == len(raw_terms) - 1)
+            word = raw.rstrip("*")
+            tokens = tokenize(word)
+            for index, token in enumerate(tokens):
+                # Only a token that ends the word can be unfinished ("c++" is complete).
+                is_prefix = wants_prefix and index == len(tokens) - 1 and word.endswith(token)
+                terms.append((token, is_prefix))
+
+        scores: Optional[Dict[str, float]] = None
+        for token, is_prefix in terms:
+            term_scores: Dict[str, float] = defaultdict(float)
+            for term in self._expand(token, is_prefix):
+                self._score_term(term, term_scores)
+            if scores is None:
+                scores = dict(term_scores)
+            else:
+                scores = {k: v + term_scores[k] for k, v in scores.items() if k in term_scores}
+            if not scores:
+                return []
+
+        ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], item[0]))
+        ids = [issue_id for issue_id, _ in ranked]
+        return ids[:limit] if limit is not None else ids
+
+    def filter(self, issues: Iterable[Issue], query: str) -> List[Issue]:
+        """Keep the issues matching ``query``, ordered by relevance."""
+        by_id = {issue.id: issue for issue in issues}
+        return [by_id[issue_id] for issue_id in self.search(query) if issue_id in by_id]
+
+    def _expand(self, token: str, is_prefix: bool) -> List[str]:
+        if not is_prefix:
+            return [token] if token in self._postings else []
+        if self._vocab_dirty:
+            self._vocab = sorted(self._postings)
+            self._vocab_dirty = False
+        start = bisect.bisect_left(self._vocab, token)
+        end = bisect.bisect_left(self._vocab, token + "\uffff")
+        return self._vocab[start:end]
+
+    def _score_term(self, term: str, scores: Dict[str, float]) -> None:
+        postings = self._postings[term]
+        doc_count = len(self._doc_terms)
+        idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+        avg_len = self._total_len / doc_count or 1.0
+        for issue_id, tf in postings.items():
+            norm = _K1 * (1 - _B + _B * self._doc_len[issue_id] / avg_len)
+            scores[issue_id] += idf * tf * (_K1 + 1) / (tf + norm)
+
+    def _add(self, issue_id: str, text: Tuple[str, str]) -> None:
+        weighted: Counter = Counter()
+        for field, value in zip(("title", "description"), text):
+            for token in tokenize(value):
+                weighted[token] += FIELD_WEIGHTS[field]
+
+        for term, tf in weighted.items():
+            if term not in self._postings:
+                self._vocab_dirty = True
+            self._postings[term][issue_id] = tf
+
+        length = float(sum(weighted.values()))
+        self._doc_terms[issue_id] = set(weighted)
+        self._doc_len[issue_id] = length
+        self._doc_text[issue_id] = text
+        self._total_len += length
+
+    def _remove(self, issue_id: str) -> None:
+        terms = self._doc_terms.pop(issue_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            postings.pop(issue_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocab_dirty = True
+        self._total_len -= self._doc_len.pop(issue_id)
+        del self._doc_text[issue_id]
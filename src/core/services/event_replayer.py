@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import requests
+
+from src.config import get_settings
+from src.core.services.ingestion_service import WebhookIngestor, store_scope
+from src.core.services.issue_store import IssueStore
+
+
+def load_events(path: Path) -> List[dict]:
+    """Read recorded webhook payloads, one JSON object per line."""
+    events = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            events.append(json.loads(line))
+    return events
+
+
+def delivery_order(
+        events: Iterable[dict],
+        shuffle: bool = False,
+        duplicate_rate: float = 0.0,
+        seed: Optional[int] = None,
+) -> List[dict]:
+    """
+    Reproduce real delivery conditions: optional reordering and redelivery.
+
+    Each payload gets a stable ``_delivery_id`` so duplicates look like Jira retries.
+    """
+    rng = random.Random(seed)
+    deliveries = []
+    for index, event in enumerate(events):
+        event = dict(event, _delivery_id=event.get("_delivery_id") or f"replay-{index}")
+        deliveries.append(event)
+        if duplicate_rate and rng.random() < duplicate_rate:
+            deliveries.append(event)
+    if shuffle:
+        rng.shuffle(deliveries)
+    return deliveries
+
+
+def replay(events: Iterable[dict], ingestor: WebhookIngestor) -> None:
+    """Feed events straight into an ingestor, then flush what is left."""
+    for event in events:
+        ingestor.submit(event, event.get("_delivery_id"))
+    ingestor.flush()
+
+
+def post(events: Iterable[dict], url: str) -> None:
+    """Send events to a running webhook endpoint."""
+    for event in events:
+        response = requests.post(
+            url,
+            json=event,
+            timeout=10,
+            headers={"X-Atlassian-Webhook-Identifier": event.get("_delivery_id", "")},
+        )
+        response.raise_for_status()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay recorded Jira webhook events.")
+    parser.add_argument("events", help="JSONL file of webhook payloads.")
+    parser.add_argument("--url", help="POST to this endpoint instead of applying to an in-memory store.")
+    parser.add_argument("--shuffle", action="store_true", help="Deliver out of order.")
+    parser.add_argument("--duplicates", type=float, default=0.0, help="Redelivery rate (0-1).")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    events = delivery_order(load_events(args.events), args.shuffle, args.duplicates, args.seed)
+    if args.url:
+        post(events, args.url)
+        print(f"Posted {len(events)} events to {args.url}")
+        return
+
+    # The receiver owns the on-disk store; a local replay works on an in-memory copy.
+    settings = get_settings()
+    ingestor = WebhookIngestor(IssueStore(), scope=store_scope(settings))
+    replay(events, ingestor)
+    print(f"Replayed {len(events)} events: {ingestor.stats}, store has {len(ingestor.store)} issues")
+
+
+if __name__ == "__main__":
+    main()
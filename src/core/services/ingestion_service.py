@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.core.clients.base_client import BaseClient
+from src.core.clients.jira_client import JiraClient
+from src.core.clients.jql import JqlQuery
+from src.core.duplicates import SignatureStore
+from src.core.services.issue_store import STORE_FILENAME, IssueStore
+from src.models.issue import Issue
+
+ISSUE_EVENTS = {"jira:issue_created", "jira:issue_updated", "jira:issue_deleted"}
+# Upper bound for the one-off Jira fetch that fills an empty issue store.
+STORE_SEED_LIMIT = 5000
+
+# (issue key, version, webhook event, mapped issue or None for deletes)
+_Entry = Tuple[str, int, str, Optional[Issue]]
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookIngestor:
+    """
+    Buffers Jira issue webhooks and applies them to an IssueStore in batches.
+
+    Redeliveries are dropped by delivery id (or event key/timestamp when no id is
+    sent); within a batch only the newest event per issue is kept, and the store's
+    per-issue versions reject anything older than what was already applied. Issues
+    that do not match ``scope`` are removed from the store rather than stored.
+    """
+
+    def __init__(
+            self,
+            store: IssueStore,
+            batch_size: int = 200,
+            flush_interval: float = 2.0,
+            seen_capacity: int = 50_000,
+            scope: Optional[JqlQuery] = None,
+    ) -> None:
+        self.store = store
+        self.scope = scope
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.seen_capacity = seen_capacity
+        self._buffer: List[_Entry] = []
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"received": 0, "duplicates": 0, "ignored": 0, "rejected": 0, "applied": 0}
+
+    def submit(self, payload: dict, delivery_id: Optional[str] = None) -> bool:
+        """
+        Queue one webhook payload. Returns False if it was ignored or a duplicate;
+        raises ValueError for malformed payloads, which are not marked as seen.
+        """
+        self.stats["received"] += 1
+        if not isinstance(payload, dict):
+            self.stats["rejected"] += 1
+            raise ValueError("webhook payload must be a JSON object")
+        event = payload.get("webhookEvent")
+        if event not in ISSUE_EVENTS:
+            self.stats["ignored"] += 1
+            return False
+        try:
+            entry = _prepare(event, payload)
+        except ValueError:
+            self.stats["rejected"] += 1
+            raise
+
+        dedupe_key = delivery_id or f"{event}:{entry[0]}:{payload.get('timestamp')}"
+        with self._lock:
+            if dedupe_key in self._seen:
+                self.stats["duplicates"] += 1
+                return False
+            self._seen[dedupe_key] = None
+            if len(self._seen) > self.seen_capacity:
+                self._seen.popitem(last=False)
+            self._buffer.append(entry)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001
+                # The event is buffered and is retried with the batch on the next flush.
+                logger.exception("Flushing webhook batch failed")
+        return True
+
+    def flush(self) -> Tuple[int, int]:
+        """Apply buffered events; returns (issues changed, issues removed)."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0, 0
+
+            latest: Dict[str, _Entry] = {}
+            for entry in batch:
+                key, version = entry[0], entry[1]
+                if key not in latest or version >= latest[key][1]:
+                    latest[key] = entry
+
+            upserts = []
+            deletes = []
+            for key, version, event, issue in latest.values():
+                # An issue leaving the scope is dropped; a newer in-scope event re-adds it.
+                if event == "jira:issue_deleted" or not self._in_scope(issue):
+                    deletes.append((key, version))
+                else:
+                    upserts.append((issue, version))
+
+            try:
+                changed, removed = self.store.apply(upserts=upserts, deletes=deletes)
+                if changed or removed:
+                    self.store.save()
+            except Exception:
+                # Put the batch back; re-applying is safe because versions are checked.
+                with self._lock:
+                    self._buffer[:0] = batch
+                raise
+            self.stats["applied"] += len(batch)
+            return len(changed), len(removed)
+
+    def seed(self, client: BaseClient, jql: Optional[str], limit: int = STORE_SEED_LIMIT) -> None:
+        """
+        Fill an empty store with one JQL fetch, or drop stored issues outside the
+        scope (which may have changed since they were stored).
+        """
+        if not len(self.store):
+            issues = [issue for issue in client.fetch_issues(jql=jql, max_results=limit) if self._in_scope(issue)]
+            self.store.replace_all(issues, version=int(time.time() * 1000))
+        else:
+            self.store.apply(
+                deletes=[
+                    (issue.id, self.store.version(issue.id))
+                    for issue in self.store.issues()
+                    if not self._in_scope(issue)
+                ]
+            )
+        self.store.save()
+
+    def start(self) -> "WebhookIngestor":
+        """Flush on a timer in a daemon thread so small trickles still land quickly."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._flush_loop, name="webhook-flush", daemon=True)
+            self._thread.start()
+        return self
+
+    def _in_scope(self, issue: Issue) -> bool:
+        return self.scope is None or self.scope.matches(issue)
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001
+                logger.exception("Flushing webhook batch failed; retrying on the next tick")
+
+
+def build_ingestor(settings: dict) -> WebhookIngestor:
+    """Wire the on-disk issue store to an ingestor and the caches derived from it."""
+    cache_dir = Path(settings["cache_output_dir"])
+    store = IssueStore(cache_dir / STORE_FILENAME)
+    signatures_path = cache_dir / "title_signatures.json"
+
+    def drop_signatures(_changed, removed) -> None:
+        if removed:
+            # Report runs write this file too; start from what is on disk now.
+            signatures = SignatureStore(signatures_path)
+            signatures.discard(removed)
+            signatures.save()
+
+    store.subscribe(drop_signatures)
+    return WebhookIngestor(store, scope=store_scope(settings))
+
+
+def store_scope(settings: dict) -> Optional[JqlQuery]:
+    """
+    The part of the default JQL the receiver enforces on stored issues.
+
+    Only locally decidable clauses can be kept true as webhooks arrive; others
+    (such as date windows) are not enforced and must not be assumed to hold.
+    """
+    query = JqlQuery.parse(settings.get("jira_default_jql") or "")
+    if query is None:
+        return None
+    local = query.local_part()
+    return local if local.clauses else None
+
+
+def _prepare(event: str, payload: dict) -> _Entry:
+    """Validate and map a payload up front so one bad event cannot spoil a batch."""
+    issue = payload.get("issue")
+    if not isinstance(issue, dict) or not issue.get("key"):
+        raise ValueError("webhook payload has no issue key")
+    if not isinstance(issue.get("fields", {}), dict):
+        raise ValueError("issue fields must be a JSON object")
+
+    timestamp = payload.get("timestamp")
+    if timestamp is not None:
+        try:
+            version = int(timestamp)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid webhook timestamp: {timestamp!r}") from None
+    else:
+        version = None
+
+    mapped = None
+    if event != "jira:issue_deleted" or version is None:
+        try:
+            mapped = JiraClient._to_issue(issue)
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise ValueError(f"cannot read issue {issue['key']}: {exc}") from None
+    if version is None:
+        version = int(mapped.updated.timestamp() * 1000) if mapped.updated else 0
+    return issue["key"], version, event, mapped
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.models.issue import Issue
+
+Listener = Callable[[List[Issue], List[str]], None]
+
+STORE_FILENAME = "issues.json"
+
+
+class IssueStore:
+    """
+    In-memory issue set mirrored to a JSON file, kept current by webhook events.
+    The webhook receiver is the file's only writer; other processes ``reload`` it.
+
+    Every key carries the version (event timestamp in ms) of the last change
+    applied to it, deletions included, so late or replayed events are ignored.
+    Listeners are told which issues changed or disappeared after each batch.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path else None
+        self._issues: Dict[str, Issue] = {}
+        self._versions: Dict[str, int] = {}
+        self._listeners: List[Listener] = []
+        self._lock = threading.RLock()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def issues(self) -> List[Issue]:
+        with self._lock:
+            return list(self._issues.values())
+
+    def get(self, issue_id: str) -> Optional[Issue]:
+        return self._issues.get(issue_id)
+
+    def version(self, issue_id: str) -> int:
+        """Version of the last change applied to ``issue_id`` (-1 if none)."""
+        return self._versions.get(issue_id, -1)
+
+    def subscribe(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def apply(
+            self,
+            upserts: Iterable[Tuple[Issue, int]] = (),
+            deletes: Iterable[Tuple[str, int]] = (),
+    ) -> Tuple[List[Issue], List[str]]:
+        """Apply versioned changes; stale ones are skipped. Returns what changed."""
+        changed: List[Issue] = []
+        removed: List[str] = []
+        with self._lock:
+            for issue, version in upserts:
+                if version < self._versions.get(issue.id, -1):
+                    continue
+                self._versions[issue.id] = version
+                if self._issues.get(issue.id) != issue:
+                    self._issues[issue.id] = issue
+                    changed.append(issue)
+            for issue_id, version in deletes:
+                if version < self._versions.get(issue_id, -1):
+                    continue
+                self._versions[issue_id] = version
+                if self._issues.pop(issue_id, None) is not None:
+                    removed.append(issue_id)
+
+        if changed or removed:
+            for listener in self._listeners:
+                listener(changed, removed)
+        return changed, removed
+
+    def replace_all(self, issues: Iterable[Issue], version: int) -> None:
+        """Seed the store from a full JQL fetch taken at ``version``."""
+        issue_list = list(issues)
+        keep = {issue.id for issue in issue_list}
+        self.apply(
+            upserts=[(issue, version) for issue in issue_list],
+            deletes=[(issue_id, version) for issue_id in list(self._issues) if issue_id not in keep],
+        )
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            payload = {
+                "issues": [issue.model_dump(mode="json") for issue in self._issues.values()],
+                "versions": dict(self._versions),
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def load(self) -> None:
+        data = self._read()
+        if data is None:
+            return
+        with self._lock:
+            self._issues, self._versions = data
+
+    def reload(self) -> Tuple[List[Issue], List[str]]:
+        """Pick up a file written by another process; listeners get the differences."""
+        data = self._read()
+        if data is None:
+            return [], []
+        issues, versions = data
+        with self._lock:
+            changed = [issue for issue_id, issue in issues.items() if self._issues.get(issue_id) != issue]
+            removed = [issue_id for issue_id in self._issues if issue_id not in issues]
+            self._issues, self._versions = issues, versions
+
+        if changed or removed:
+            for listener in self._listeners:
+                listener(changed, removed)
+        return changed, removed
+
+    def _read(self) -> Optional[Tuple[Dict[str, Issue], Dict[str, int]]]:
+        if not self.path or not self.path.exists():
+            return None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        issues = {item["id"]: Issue.model_validate(item) for item in data.get("issues", [])}
+        versions = {k: int(v) for k, v in data.get("versions", {}).items()}
+        return issues, versions
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional
+
+from src.core.analyzer import analyze_issues
+from src.core.dependencies import DependencyGraph
+from src.core.hierarchy import HierarchyIndex
+from src.core.services.issue_store import IssueStore
+from src.models.issue import Issue
+
+
+class LiveAnalysis:
+    """
+    Analysis indexes for an IssueStore, updated from the store's change listener.
+
+    Only the issues named in each change notification are applied to the indexes,
+    so a webhook batch touching a few issues does not rebuild them. The summary is
+    recomputed on demand after a change.
+    """
+
+    def __init__(self, store: IssueStore) -> None:
+        self.store = store
+        self.hierarchy = HierarchyIndex(store.issues())
+        self.graph = DependencyGraph(store.issues())
+        self._summary: Optional[Dict[str, object]] = None
+        self._mtime_ns: Optional[int] = self._file_mtime()
+        self._lock = threading.RLock()
+        store.subscribe(self._on_change)
+
+    @property
+    def fingerprint(self) -> str:
+        return f"store:{self._mtime_ns}"
+
+    def issues(self) -> List[Issue]:
+        return self.store.issues()
+
+    def refresh(self) -> None:
+        """Reload the store file if another process has rewritten it."""
+        with self._lock:
+            mtime_ns = self._file_mtime()
+            if mtime_ns != self._mtime_ns:
+                self._mtime_ns = mtime_ns
+                self.store.reload()
+
+    def summary(self) -> Dict[str, object]:
+        with self._lock:
+            if self._summary is None:
+                self._summary = analyze_issues(self.store.issues(), hierarchy=self.hierarchy, graph=self.graph)
+            return self._summary
+
+    def _on_change(self, changed: List[Issue], removed: List[str]) -> None:
+        with self._lock:
+            self.hierarchy.update(changed)
+            self.hierarchy.remove(removed)
+            self.graph.update(changed)
+            self.graph.remove(removed)
+            self._summary = None
+
+    def _file_mtime(self) -> Optional[int]:
+        path = self.store.path
+        return path.stat().st_mtime_ns if path is not None and path.exists() else None
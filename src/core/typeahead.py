@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from src.core.clients.base_client import BaseClient
+
+
+class PrefixIndex:
+    """Sorted, case-insensitive prefix index; each word of a value is also a key."""
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        unique = sorted({v for v in values if v}, key=str.lower)
+        entries: List[Tuple[str, int]] = []
+        for rank, value in enumerate(unique):
+            lowered = value.lower()
+            entries.append((lowered, rank))
+            words = lowered.split()
+            for i in range(1, len(words)):
+                entries.append((" ".join(words[i:]), rank))
+        entries.sort()
+        self._values = unique
+        self._keys = [key for key, _ in entries]
+        self._ranks = [rank for _, rank in entries]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def values(self) -> List[str]:
+        return list(self._values)
+
+    def search(self, prefix: str, limit: Optional[int] = 100) -> List[str]:
+        """Values with a word starting with ``prefix``, in alphabetical order."""
+        prefix = (prefix or "").strip().lower()
+        if not prefix:
+            return self._values[:limit] if limit is not None else list(self._values)
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix + "\uffff")
+        ranks = sorted(set(self._ranks[start:end]))
+        if limit is not None:
+            ranks = ranks[:limit]
+        return [self._values[rank] for rank in ranks]
+
+
+class TypeaheadStore:
+    """
+    Bulk-loaded assignee and label indexes for sidebar typeahead.
+
+    ``start()`` loads and then refreshes everything in a daemon thread; until the
+    first load lands ``loaded`` is False and callers use per-query lookups. Readers
+    always see a complete index because refreshed ones are swapped in whole.
+    """
+
+    def __init__(self, client: BaseClient, refresh_interval: int = 900, retry_interval: int = 60) -> None:
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.assignees = PrefixIndex()
+        self.labels = PrefixIndex()
+        self.loaded_at: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def refresh(self) -> None:
+        try:
+            assignees = PrefixIndex(self.client.fetch_all_assignees())
+            labels = PrefixIndex(self.client.fetch_all_labels())
+        except Exception as exc:  # noqa: BLE001
+            # Keep serving the previous indexes; callers can inspect last_error.
+            self.last_error = exc
+            return
+        self.assignees, self.labels = assignees, labels
+        self.loaded_at = time.time()
+        self.last_error = None
+
+    def start(self) -> "TypeaheadStore":
+        with self._lock:
+            if self._thread is not None:
+                return self
+            self._thread = threading.Thread(target=self._refresh_loop, name="typeahead-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def _refresh_loop(self) -> None:
+        while True:
+            self.refresh()
+            # Retry sooner while the first load has not succeeded.
+            time.sleep(self.refresh_interval if self.loaded else self.retry_interval)
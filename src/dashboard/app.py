@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import streamlit as st
@@ -8,10 +10,128 @@ import streamlit as st
 from src.config import get_settings
 from src.core.analyzer import analyze_issues
 from src.core.clients.jira_client import JiraClient
-from src.dashboard.charts.bar import render_bar_chart
+from src.core.clients.jql import JqlQuery, QueryResultCache
+from src.core.search_index import SearchIndex
+from src.core.services.issue_store import STORE_FILENAME, IssueStore
+from src.core.services.live_analysis import LiveAnalysis
+from src.dashboard.charts.bar import build_bar_chart, render_chart
 from src.dashboard.components.filters import render_filters
-from src.dashboard.components.tables import issues_to_rows, render_blockers_table, render_issues_table
+from src.dashboard.components.tables import issues_to_frame, render_blockers_table, render_issues_table
+from src.dashboard.utils import ArtifactCache, Recipe, dataset_fingerprint
 from src.models.issue import Issue
+from src.utils.profiler import StageProfiler
+
+
+def _counts_frame(counts: Counter, category_col: str) -> pd.DataFrame:
+    return pd.DataFrame([{category_col: k, "count": v} for k, v in (counts or {}).items()])
+
+
+# Derived artifacts for one fetched batch; each entry lists the inputs it is built from.
+ARTIFACT_RECIPES: Dict[str, Recipe] = {
+    "summary": (("issues",), analyze_issues),
+    "priority_frame": (("summary",), lambda summary: _counts_frame(summary["priorities"], "priority")),
+    "status_frame": (("summary",), lambda summary: _counts_frame(summary["statuses"], "status")),
+    "priority_chart": (("priority_frame",), lambda df: build_bar_chart(df, "priority", "count", "Issues by priority")),
+    "status_chart": (("status_frame",), lambda df: build_bar_chart(df, "status", "count", "Issues by status")),
+    "blockers_frame": (("summary", "jira_base_url"), lambda summary, base: issues_to_frame(summary["blockers"], base)),
+    "issues_frame": (("issues", "jira_base_url"), issues_to_frame),
+}
+
+
+def _artifact_cache() -> ArtifactCache:
+    if "_artifact_cache" not in st.session_state:
+        st.session_state["_artifact_cache"] = ArtifactCache(ARTIFACT_RECIPES, max_datasets=8)
+    return st.session_state["_artifact_cache"]
+
+
+def _query_cache() -> QueryResultCache:
+    if "_query_cache" not in st.session_state:
+        st.session_state["_query_cache"] = QueryResultCache()
+    return st.session_state["_query_cache"]
+
+
+def _search_index(issues: List[Issue], fingerprint: str) -> SearchIndex:
+    """Session search index, re-synced incrementally when a new batch is loaded."""
+    index = st.session_state.get("_search_index")
+    if index is None:
+        index = st.session_state["_search_index"] = SearchIndex()
+    if st.session_state.get("_search_index_fingerprint") != fingerprint:
+        index.sync(issues)
+        st.session_state["_search_index_fingerprint"] = fingerprint
+    return index
+
+
+@st.cache_resource
+def _live_analysis(path: str) -> LiveAnalysis:
+    """One store mirror shared by all sessions, updated as the receiver rewrites it."""
+    return LiveAnalysis(IssueStore(Path(path)))
+
+
+def _store_issues(settings: dict) -> Tuple[List[Issue], Optional[str], Optional[LiveAnalysis]]:
+    """Webhook-synced issues; changes on disk are applied to the shared indexes."""
+    path = Path(settings["cache_output_dir"]) / STORE_FILENAME
+    if not path.exists():
+        return [], None, None
+    live = _live_analysis(str(path.resolve()))
+    live.refresh()
+    return live.issues(), live.fingerprint, live
+
+
+def _filter_store_issues(
+        filters: dict,
+        issues: List[Issue],
+        fingerprint: str,
+) -> Tuple[List[Issue], str]:
+    """Apply the custom JQL or sidebar filters to the store's issues locally."""
+    if filters["custom_jql"]:
+        query = JqlQuery.parse(filters["custom_jql"])
+        if query is None:
+            raise ValueError("custom JQL uses OR, NOT, functions or other unsupported syntax")
+    else:
+        query = JqlQuery.from_filters(
+            {
+                "project": filters["project_keys"],
+                "status": filters["statuses"],
+                "priority": filters["priorities"],
+                "assignee": filters["assignees"],
+                "labels": filters["labels"],
+            }
+        )
+    matching = query.filter(issues)
+    if len(matching) == len(issues):
+        return issues, fingerprint
+    return matching, f"{fingerprint}:{query.to_jql()}"
+
+
+def _refresh_loaded_issues(settings: dict, issues: List[Issue]) -> List[Issue]:
+    client = JiraClient(
+        base_url=settings["jira_base_url"],
+        email=settings["jira_email"],
+        api_token=settings["jira_api_token"],
+        verify_ssl=settings["jira_verify_ssl"],
+    )
+    try:
+        changed, missing = client.refresh_issues([issue.id for issue in issues], known=issues)
+    except Exception as exc:  # noqa: BLE001
+        st.sidebar.warning(f"Could not refresh issues: {exc}")
+        return issues
+
+    st.sidebar.caption(
+        f"{len(changed)} issue(s) changed and {len(missing)} removed or hidden since the last fetch."
+    )
+    if not changed and not missing:
+        return issues
+
+    by_id = {issue.id: issue for issue in changed}
+    gone = set(missing)
+    refreshed = [by_id.pop(issue.id, issue) for issue in issues if issue.id not in gone]
+    # Moved issues come back under their new key.
+    issues = refreshed + list(by_id.values())
+    st.session_state["issues"] = issues
+    st.session_state["issues_fingerprint"] = dataset_fingerprint(issues)
+    # Cached search results may hold the old versions.
+    _query_cache().clear()
+    return issues
 
 
 def _bounded_default_jql(project_keys: Optional[List[str]]) -> str:
@@ -34,11 +154,42 @@ def main() -> None:
     # Sidebar - Filters (component)
     # -------------------------
     filters, should_fetch = render_filters(settings)
+    profile = st.sidebar.checkbox(
+        "Profile this run",
+        value=False,
+        help="Write per-stage CPU stacks and memory peaks to LOG_OUTPUT_DIR.",
+        key="profile_run",
+    )
+    profiler = StageProfiler(settings["log_output_dir"], enabled=profile)
+    with profiler:
+        _show_issues(settings, filters, should_fetch, profiler)
+
+    if profile:
+        folded_path, table_path = profiler.write(prefix="dashboard-profile")
+        st.sidebar.caption(f"Profile written to {folded_path} and {table_path}")
+
 
+def _show_issues(settings: dict, filters: dict, should_fetch: bool, profiler: StageProfiler) -> None:
     # -------------------------
     # Fetch & Cache in session_state
     # -------------------------
-    if should_fetch:
+    if filters["use_store"]:
+        issues, fingerprint, live = _store_issues(settings)
+        if not issues:
+            st.info("The webhook store is empty. Start src/api/server.py and point Jira webhooks at it.")
+            return
+        try:
+            filtered, fingerprint = _filter_store_issues(filters, issues, fingerprint)
+        except ValueError as exc:
+            st.error(f"Cannot apply these filters to live data: {exc}")
+            return
+        if len(filtered) != len(issues):
+            live = None
+        issues = filtered
+        if not issues:
+            st.info("No live issues match the current filters.")
+            return
+    elif should_fetch:
         try:
             client = JiraClient(
                 base_url=settings["jira_base_url"],
@@ -55,69 +206,96 @@ def main() -> None:
                     filters["priorities"],
                     filters["assignees"],
                     filters["labels"],
-                    filters["text_search"],
                 ]):
                     final_jql = None
                 else:
                     final_jql = _bounded_default_jql(filters["project_keys"])
 
-            issues = list(
-                client.fetch_issues(
-                    jql=final_jql,
-                    project_keys=filters["project_keys"],
-                    statuses=filters["statuses"],
-                    priorities=filters["priorities"],
-                    assignees=filters["assignees"],
-                    labels=filters["labels"],
-                    text_search=filters["text_search"],
-                    max_results=filters["max_results"],
-                )
-            )
+            filter_kwargs = {
+                "project_keys": filters["project_keys"],
+                "statuses": filters["statuses"],
+                "priorities": filters["priorities"],
+                "assignees": filters["assignees"],
+                "labels": filters["labels"],
+            }
+            query = client.plan_query(final_jql, **filter_kwargs)
+            query_cache = _query_cache()
+            issues = query_cache.get(query, filters["max_results"]) if query else None
+            if issues is None:
+                with profiler.stage("fetch"):
+                    raw_issues = client.fetch_raw_issues(
+                        jql=final_jql, max_results=filters["max_results"], **filter_kwargs
+                    )
+                with profiler.stage("map"):
+                    issues = [JiraClient._to_issue(item) for item in raw_issues]
+                if query:
+                    query_cache.put(query, filters["max_results"], issues)
 
             st.session_state["issues"] = issues
+            st.session_state["issues_fingerprint"] = dataset_fingerprint(issues)
 
         except Exception as exc:  # noqa: BLE001
             st.error(f"Failed to fetch issues: {exc}")
             return
 
-    issues: List[Issue] = st.session_state.get("issues", [])
+    if not filters["use_store"]:
+        live = None
+        issues: List[Issue] = st.session_state.get("issues", [])
 
-    if not issues:
-        st.info("Set filters and click 'Fetch issues' to load data.")
-        return
+        if not issues:
+            st.info("Set filters and click 'Fetch issues' to load data.")
+            return
+
+        if st.sidebar.button("Refresh loaded issues", key="refresh_btn", help="Re-read only these issues by key."):
+            issues = _refresh_loaded_issues(settings, issues)
+
+        fingerprint = st.session_state.get("issues_fingerprint") or dataset_fingerprint(issues)
 
     # -------------------------
     # Analyze & Display
     # -------------------------
-    summary = analyze_issues(issues)
+    text_query = filters["text_search"] or ""
+    if text_query:
+        with profiler.stage("search"):
+            issues = _search_index(issues, fingerprint).filter(issues, text_query)
+        if not issues:
+            st.info(f"No loaded issues match '{text_query}'.")
+            return
+        live = None
 
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Total issues", summary["total"])
-    col2.metric("Blockers", len(summary["blockers"]))
-    col3.metric("Unique statuses", len(summary["statuses"]))
+    cache = _artifact_cache()
+    cache_key = (fingerprint, settings["jira_base_url"], text_query)
+    inputs = {"issues": issues, "jira_base_url": settings["jira_base_url"]}
 
-    # Charts
-    st.subheader("By priority")
-    pr_df = pd.DataFrame(
-        [{"priority": k, "count": v} for k, v in (summary["priorities"] or {}).items()]
-    )
-    render_bar_chart(pr_df, "priority", "count", "Issues by priority")
+    def artifact(name: str):
+        return cache.get(cache_key, name, inputs)
 
-    st.subheader("By status")
-    st_df = pd.DataFrame(
-        [{"status": k, "count": v} for k, v in (summary["statuses"] or {}).items()]
-    )
-    render_bar_chart(st_df, "status", "count", "Issues by status")
+    with profiler.stage("analyze"):
+        if live is not None:
+            # The whole store is shown, so its incrementally maintained summary applies.
+            inputs["summary"] = live.summary()
+        summary = artifact("summary")
+
+    with profiler.stage("render"):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Total issues", summary["total"])
+        col2.metric("Blockers", len(summary["blockers"]))
+        col3.metric("Unique statuses", len(summary["statuses"]))
+
+        # Charts
+        st.subheader("By priority")
+        render_chart(artifact("priority_chart"))
+
+        st.subheader("By status")
+        render_chart(artifact("status_chart"))
 
-    # Blockers
-    if summary["blockers"]:
-        st.subheader("Current blockers")
-        blockers_rows = issues_to_rows(summary["blockers"], settings["jira_base_url"])
-        render_blockers_table(blockers_rows)
+        # Blockers
+        if summary["blockers"]:
+            st.subheader("Current blockers")
+            render_blockers_table(artifact("blockers_frame"))
 
-    st.subheader("All issues")
-    rows = issues_to_rows(issues, settings["jira_base_url"])
-    render_issues_table(rows)
+        st.subheader("All issues")
+        render_issues_table(artifact("issues_frame"))
 
 
 if __name__ == "__main__":
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import pandas as pd
 import altair as alt
 import streamlit as st
 
 
-def render_bar_chart(df: pd.DataFrame, category_col: str, value_col: str, title: str) -> None:
+def build_bar_chart(df: pd.DataFrame, category_col: str, value_col: str, title: str) -> Optional[alt.Chart]:
     if df.empty:
-        st.write("No data.")
-        return
+        return None
 
     df = df.sort_values(value_col, ascending=False)
 
-    chart = (
+    return (
         alt.Chart(df)
         .mark_bar()
         .encode(
@@ -23,4 +24,11 @@ def render_bar_chart(df: pd.DataFrame, category_col: str, value_col: str, title:
         .properties(height=260, title=title)
     )
 
+
+def render_chart(chart: Optional[alt.Chart]) -> None:
+    if chart is None:
+        st.write("No data.")
+        return
+
     st.altair_chart(chart, use_container_width=True)
+
@@ -5,6 +5,10 @@ from typing import Dict, List, Optional, Tuple
 import streamlit as st
 
 from src.core.clients.jira_client import JiraClient
+from src.core.typeahead import TypeaheadStore
+
+# Same as Jira's label page size, which prefix searches used to return.
+LABEL_OPTIONS_LIMIT = 1000
 
 
 @st.cache_data(ttl=300)
@@ -37,6 +41,23 @@ def _fetch_labels(base_url: str, email: str, api_token: str, verify_ssl: bool, q
     return client.fetch_labels(query)
 
 
+@st.cache_resource
+def _typeahead_store(base_url: str, email: str, api_token: str, verify_ssl: bool) -> TypeaheadStore:
+    """One bulk-loaded, background-refreshed store shared by all sessions."""
+    client = JiraClient(base_url=base_url, email=email, api_token=api_token, verify_ssl=verify_ssl)
+    return TypeaheadStore(client).start()
+
+
+def _get_typeahead(settings: dict) -> Optional[TypeaheadStore]:
+    store = _typeahead_store(
+        settings["jira_base_url"],
+        settings["jira_email"],
+        settings["jira_api_token"],
+        settings["jira_verify_ssl"],
+    )
+    return store if store.loaded else None
+
+
 def _get_projects(settings: dict) -> List[str]:
     if "_projects_options" not in st.session_state:
         try:
@@ -86,6 +107,9 @@ def _get_priorities(settings: dict) -> List[str]:
 
 
 def _get_assignees(settings: dict) -> List[str]:
+    store = _get_typeahead(settings)
+    if store is not None:
+        return store.assignees.values()
     if "_assignees_options" not in st.session_state:
         try:
             st.session_state["_assignees_options"] = _fetch_assignees(
@@ -102,6 +126,10 @@ def _get_assignees(settings: dict) -> List[str]:
 
 
 def _get_labels(settings: dict, query: str) -> List[str]:
+    store = _get_typeahead(settings)
+    if store is not None:
+        # An empty search lists every label, as the full Jira page did before.
+        return store.labels.search(query, limit=LABEL_OPTIONS_LIMIT if query else None)
     labels_cache = st.session_state.setdefault("_labels_by_query", {})
     cache_key = query or "__all__"
     if cache_key not in labels_cache:
@@ -123,6 +151,12 @@ def render_filters(settings: dict) -> Tuple[Dict[str, Optional[List[str]]], bool
     st.sidebar.header("Filters")
 
     auto_fetch = st.sidebar.checkbox("Auto-fetch on change", value=False, key="auto_fetch")
+    use_store = st.sidebar.checkbox(
+        "Live data (webhook store)",
+        value=False,
+        help="Show issues kept current by the Jira webhook receiver instead of fetching.",
+        key="use_store",
+    )
 
     custom_jql = st.sidebar.text_area(
         "Custom JQL (overrides filters)",
@@ -173,6 +207,9 @@ def render_filters(settings: dict) -> Tuple[Dict[str, Optional[List[str]]], bool
 
     label_query = st.sidebar.text_input("Label search", value="", key="label_query")
     labels_options = _get_labels(settings, label_query) if project_keys else []
+    # Keep current selections valid when the search prefix narrows the options.
+    selected_labels = st.session_state.get("filter_labels", [])
+    labels_options = labels_options + [l for l in selected_labels if l not in labels_options]
     labels = st.sidebar.multiselect(
         "Labels",
         options=labels_options,
@@ -181,7 +218,12 @@ def render_filters(settings: dict) -> Tuple[Dict[str, Optional[List[str]]], bool
         key="filter_labels",
     )
 
-    text_search = st.sidebar.text_input("Text search", value="", key="text_search") or None
+    text_search = st.sidebar.text_input(
+        "Text search",
+        value="",
+        help="Searches loaded issues locally (title and description); no refetch needed.",
+        key="text_search",
+    ) or None
     max_results = st.sidebar.slider("Max results", min_value=10, max_value=200, value=50, step=10, key="max_results")
 
     st.sidebar.caption("Tip: If Custom JQL is set, other filters are ignored.")
@@ -197,6 +239,7 @@ def render_filters(settings: dict) -> Tuple[Dict[str, Optional[List[str]]], bool
         "labels": labels or None,
         "text_search": text_search,
         "max_results": max_results,
+        "use_store": use_store,
     }
 
     current_filters_sig = (
@@ -206,7 +249,6 @@ def render_filters(settings: dict) -> Tuple[Dict[str, Optional[List[str]]], bool
         tuple(filters["priorities"] or []),
         tuple(filters["assignees"] or []),
         tuple(filters["labels"] or []),
-        filters["text_search"] or "",
         filters["max_results"],
     )
     prev_sig = st.session_state.get("_filters_sig")
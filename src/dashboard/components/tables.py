@@ -27,8 +27,11 @@ def issues_to_rows(issues: Iterable[Issue], jira_base_url: str) -> List[dict]:
     return rows
 
 
-def render_blockers_table(rows: List[dict]) -> None:
-    df = pd.DataFrame(rows)
+def issues_to_frame(issues: Iterable[Issue], jira_base_url: str) -> pd.DataFrame:
+    return pd.DataFrame(issues_to_rows(issues, jira_base_url))
+
+
+def render_blockers_table(df: pd.DataFrame) -> None:
     st.dataframe(
         df,
         use_container_width=True,
@@ -40,8 +43,7 @@ def render_blockers_table(rows: List[dict]) -> None:
     )
 
 
-def render_issues_table(rows: List[dict]) -> None:
-    df = pd.DataFrame(rows)
+def render_issues_table(df: pd.DataFrame) -> None:
     st.dataframe(
         df,
         use_container_width=True,
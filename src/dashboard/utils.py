@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+from src.models.issue import Issue
+
+Recipe = Tuple[Tuple[str, ...], Callable[..., Any]]
+
+
+def dataset_fingerprint(issues: Iterable[Issue]) -> str:
+    """Content hash of a fetched batch; identical batches share cached artifacts."""
+    digest = hashlib.blake2b(digest_size=16)
+    for issue in issues:
+        digest.update(issue.model_dump_json().encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Memoizes derived artifacts (summary, frames, chart specs) per dataset key.
+
+    Each recipe names the inputs or other artifacts it depends on, so asking for a
+    chart computes only the missing steps of its chain. The least recently used
+    datasets are evicted once more than ``max_datasets`` are held.
+    """
+
+    def __init__(self, recipes: Dict[str, Recipe], max_datasets: int = 4) -> None:
+        self.recipes = recipes
+        self.max_datasets = max_datasets
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, name: str, inputs: Dict[str, Any]) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {}
+            while len(self._entries) > self.max_datasets:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        return self._resolve(entry, name, inputs)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _resolve(self, entry: Dict[str, Any], name: str, inputs: Dict[str, Any]) -> Any:
+        if name in entry:
+            return entry[name]
+        if name in inputs:
+            return inputs[name]
+        deps, build = self.recipes[name]
+        value = build(*(self._resolve(entry, dep, inputs) for dep in deps))
+        entry[name] = value
+        return value
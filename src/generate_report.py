@@ -10,10 +10,36 @@ def main() -> None:
         dest="jql",
         help="Optional JQL to override default filters.",
     )
+    parser.add_argument(
+        "--text",
+        dest="text_search",
+        help="Optional text query applied locally to titles and descriptions.",
+    )
+    parser.add_argument(
+        "--from-store",
+        dest="from_store",
+        action="store_true",
+        help="Report on the webhook-synced issue store instead of re-running JQL.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write per-stage CPU stacks and memory peaks to LOG_OUTPUT_DIR.",
+    )
     args = parser.parse_args()
 
-    output_path = run(jql=args.jql)
+    try:
+        output_path, profile_paths = run(
+            jql=args.jql,
+            text_search=args.text_search,
+            from_store=args.from_store,
+            profile=args.profile,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
     print(f"Report generated at: {output_path}")
+    if profile_paths:
+        print(f"Profile written to: {profile_paths[0]} and {profile_paths[1]}")
 
 
 if __name__ == "__main__":
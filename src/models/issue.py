@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -10,3 +13,10 @@ class Issue(BaseModel):
     priority: str = "Medium"
     assignee: str | None = None
     is_blocker: bool = False
+    issue_type: str | None = None
+    parent_id: str | None = None
+    description: str | None = None
+    labels: List[str] = []
+    blocked_by: List[str] = []
+    blocks: List[str] = []
+    updated: datetime | None = None
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import contextlib
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+TOP_ALLOCATIONS = 10
+
+# tracemalloc and the frame sampler are process-wide, so profiled runs take turns.
+_PROFILE_LOCK = threading.Lock()
+
+
+class StageProfiler:
+    """
+    Opt-in per-stage profiling for report runs.
+
+    While a stage is open, a daemon thread samples every thread's stack and
+    tracemalloc tracks the stage's peak and its largest allocation sites. ``write``
+    saves folded stacks (flamegraph.pl / speedscope compatible) and a per-stage
+    table. When disabled, ``stage`` returns a shared no-op context manager.
+
+    Stages must run inside ``with profiler:``, which waits for any other profiled
+    run in the process and always stops tracing on the way out.
+    """
+
+    def __init__(self, output_dir: str | Path, enabled: bool = False, interval: float = 0.005) -> None:
+        self.output_dir = Path(output_dir)
+        self.enabled = enabled
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.stages: List[Dict[str, object]] = []
+        self._active: List[str] = []
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started_tracemalloc = False
+        self._running = False
+
+    def __enter__(self) -> "StageProfiler":
+        if self.enabled:
+            _PROFILE_LOCK.acquire()
+            self._running = True
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._finish()
+
+    def stage(self, name: str) -> contextlib.AbstractContextManager:
+        if not self.enabled:
+            return _NO_OP
+        if not self._running:
+            raise RuntimeError("StageProfiler stages must run inside 'with profiler:'")
+        return self._profile_stage(name)
+
+    @contextlib.contextmanager
+    def _profile_stage(self, name: str) -> Iterator[None]:
+        self._active.append(name)
+        self._ensure_sampler()
+
+        before = _snapshot()
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            current, peak = tracemalloc.get_traced_memory()
+            top = _snapshot().compare_to(before, "lineno")[:TOP_ALLOCATIONS]
+            self._active.pop()
+            self.stages.append(
+                {
+                    "stage": ";".join(self._active + [name]),
+                    "wall_s": wall,
+                    "cpu_s": cpu,
+                    "peak_kib": (peak - start_memory) / 1024,
+                    "retained_kib": (current - start_memory) / 1024,
+                    "top": [(str(stat.traceback[0]), stat.size_diff / 1024, stat.count_diff) for stat in top],
+                }
+            )
+
+    def write(self, prefix: str = "profile") -> Tuple[Path, Path]:
+        """Stop sampling and write ``<prefix>-<ts>.folded`` and ``<prefix>-<ts>-stages.txt``."""
+        self._finish()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{prefix}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+        # Runs in the same microsecond (or with a coarse clock) get a counter.
+        name, counter = stem, 1
+        while (self.output_dir / f"{name}.folded").exists():
+            name, counter = f"{stem}-{counter}", counter + 1
+        folded_path = self.output_dir / f"{name}.folded"
+        table_path = self.output_dir / f"{name}-stages.txt"
+
+        folded_path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common()),
+            encoding="utf-8",
+        )
+        table_path.write_text(self._format_stages(), encoding="utf-8")
+        return folded_path, table_path
+
+    def _finish(self) -> None:
+        if not self._running:
+            return
+        try:
+            self._stop.set()
+            if self._sampler is not None:
+                self._sampler.join()
+                self._sampler = None
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        finally:
+            self._running = False
+            _PROFILE_LOCK.release()
+
+    def _format_stages(self) -> str:
+        lines = [
+            f"{'stage':<24} {'wall s':>9} {'cpu s':>9} {'peak KiB':>12} {'retained KiB':>13}",
+            "-" * 71,
+        ]
+        for stage in self.stages:
+            lines.append(
+                f"{stage['stage']:<24} {stage['wall_s']:>9.3f} {stage['cpu_s']:>9.3f} "
+                f"{stage['peak_kib']:>12.1f} {stage['retained_kib']:>13.1f}"
+            )
+        for stage in self.stages:
+            lines.append("")
+            lines.append(f"Top allocations - {stage['stage']}:")
+            for location, size_kib, count in stage["top"]:
+                lines.append(f"  {size_kib:>10.1f} KiB {count:>8} blocks  {location}")
+        return "\n".join(lines) + "\n"
+
+    def _ensure_sampler(self) -> None:
+        if self._sampler is None:
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_loop, name="stage-profiler", daemon=True)
+            self._sampler.start()
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            if not self._active:
+                continue
+            prefix = ";".join(self._active)
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                    frame = frame.f_back
+                thread_name = names.get(thread_id, str(thread_id))
+                self.samples[f"{prefix};{thread_name};{';'.join(reversed(stack))}"] += 1
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # Leave the profiler's own bookkeeping out of the allocation tables.
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+    )
+
+
+_NO_OP = contextlib.nullcontext()
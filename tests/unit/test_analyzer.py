@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+import random
+
+from src.core.analyzer import analyze_issues
+from src.core.dependencies import DependencyGraph
+from src.core.hierarchy import HierarchyIndex
+from src.core.services.issue_store import IssueStore
+from src.core.services.live_analysis import LiveAnalysis
+from src.models.issue import Issue
+
+
+def _issue(key: str, status: str = "Open", blocked_by=(), blocks=(), parent_id=None) -> Issue:
+    return Issue(
+        id=key,
+        title=f"Issue {key}",
+        status=status,
+        blocked_by=list(blocked_by),
+        blocks=list(blocks),
+        parent_id=parent_id,
+    )
+
+
+def _random_issue(rng: random.Random, key: str, keys) -> Issue:
+    return _issue(
+        key,
+        status=rng.choice(["Open", "In Progress", "Done"]),
+        blocked_by=rng.sample(keys, rng.randrange(3)),
+        blocks=rng.sample(keys, rng.randrange(3)),
+        # Parents come from earlier keys; Jira hierarchies cannot form cycles.
+        parent_id=rng.choice([None, None] + keys[:keys.index(key)]),
+    )
+
+
+def test_removed_done_issue_counts_as_open_again():
+    graph = DependencyGraph([_issue("A", blocks=["D"]), _issue("D", status="Done", blocked_by=["A"])])
+    assert graph.blocked_counts() == {"A": 0, "D": 0}
+
+    graph.remove(["D"])
+    rebuilt = DependencyGraph([_issue("A", blocks=["D"])])
+    assert graph.blocked_counts() == rebuilt.blocked_counts() == {"A": 1}
+
+
+def test_incremental_graph_matches_rebuild():
+    rng = random.Random(7)
+    keys = [f"K-{i}" for i in range(30)]
+    current = {}
+    graph = DependencyGraph()
+    for _ in range(400):
+        key = rng.choice(keys)
+        if current and rng.random() < 0.3:
+            current.pop(key, None)
+            graph.remove([key])
+        else:
+            current[key] = _random_issue(rng, key, keys)
+            graph.update([current[key]])
+
+        rebuilt = DependencyGraph(current.values())
+        assert graph.blocked_counts() == rebuilt.blocked_counts()
+        assert graph.cycles() == rebuilt.cycles()
+        assert len(graph.critical_path(keys)) == len(rebuilt.critical_path(keys))
+
+
+def test_incremental_hierarchy_matches_rebuild():
+    rng = random.Random(11)
+    keys = [f"K-{i}" for i in range(30)]
+    current = {}
+    index = HierarchyIndex()
+    for _ in range(400):
+        key = rng.choice(keys)
+        if current and rng.random() < 0.3:
+            current.pop(key, None)
+            index.remove([key])
+        else:
+            current[key] = _random_issue(rng, key, keys)
+            index.update([current[key]])
+
+        rebuilt = HierarchyIndex(current.values())
+        assert index.epics() == rebuilt.epics()
+        for other in keys:
+            assert index.rollup(other) == rebuilt.rollup(other)
+
+
+def test_live_analysis_follows_store_changes(tmp_path):
+    path = tmp_path / "issues.json"
+    writer = IssueStore(path)
+    writer.apply(upserts=[(_issue("A", blocks=["B"]), 1), (_issue("B", parent_id="E"), 1), (_issue("E"), 1)])
+    writer.save()
+
+    live = LiveAnalysis(IssueStore(path))
+    assert live.summary()["dependencies"]["blocking"] == {"A": 1}
+
+    writer.apply(upserts=[(_issue("C", blocked_by=["B"], parent_id="E"), 2)], deletes=[("A", 2)])
+    writer.save()
+    # The rewrite can land within the file system's mtime resolution.
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    live.refresh()
+
+    expected = analyze_issues(writer.issues())
+    assert live.summary()["dependencies"] == expected["dependencies"]
+    assert live.summary()["epics"] == expected["epics"]
+    assert live.summary()["epics"][0]["total"] == 2
+    assert live.summary()["dependencies"]["blocking"] == {"B": 1}
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from src.dashboard.utils import ArtifactCache
+
+
+def _cache(calls, max_datasets=4):
+    def build(label):
+        def step(*args):
+            calls.append(label)
+            return (label,) + args
+        return step
+
+    return ArtifactCache(
+        {
+            "summary": (("issues",), build("summary")),
+            "frame": (("summary",), build("frame")),
+            "chart": (("frame", "summary"), build("chart")),
+        },
+        max_datasets=max_datasets,
+    )
+
+
+def test_artifacts_reuse_their_cached_dependencies():
+    calls = []
+    cache = _cache(calls)
+    chart = cache.get("d1", "chart", {"issues": "I1"})
+    assert calls == ["summary", "frame", "chart"]
+    assert chart[0] == "chart"
+
+    assert cache.get("d1", "chart", {"issues": "I1"}) is chart
+    assert cache.get("d1", "frame", {"issues": "I1"}) == ("frame", ("summary", "I1"))
+    assert calls == ["summary", "frame", "chart"]
+
+
+def test_least_recently_used_dataset_is_evicted():
+    calls = []
+    cache = _cache(calls, max_datasets=2)
+    cache.get("d1", "summary", {"issues": "I1"})
+    cache.get("d2", "summary", {"issues": "I2"})
+    cache.get("d1", "summary", {"issues": "I1"})
+    cache.get("d3", "summary", {"issues": "I3"})
+    assert len(calls) == 3
+
+    # d1 was used more recently than d2, so only d2 is rebuilt.
+    cache.get("d1", "summary", {"issues": "I1"})
+    assert len(calls) == 3
+    cache.get("d2", "summary", {"issues": "I2"})
+    assert len(calls) == 4
+
+    cache.clear()
+    cache.get("d1", "summary", {"issues": "I1"})
+    assert len(calls) == 5
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+from src.core import duplicates
+from src.core.duplicates import SignatureStore, find_duplicates
+from src.models.issue import Issue
+
+
+def _issue(key: str, title: str) -> Issue:
+    return Issue(id=key, title=title, status="Open")
+
+
+def _ids(clusters):
+    return [[issue.id for issue in group] for group in clusters]
+
+
+def test_near_identical_titles_are_grouped():
+    issues = [
+        _issue("A-1", "Login page crashes on Safari"),
+        _issue("A-2", "Login page crashes on Safari!"),
+        _issue("A-3", "login page crashes on safari 17"),
+        _issue("A-4", "Export to CSV drops the header row"),
+        _issue("A-5", ""),
+    ]
+    assert _ids(find_duplicates(issues)) == [["A-1", "A-2", "A-3"]]
+
+
+def test_templated_titles_do_not_chain_into_one_group():
+    # A-1 is close to A-2 and A-2 to A-3, but A-1 and A-3 are not similar.
+    issues = [
+        _issue("A-1", "Deploy failed for service payments in region eu west"),
+        _issue("A-2", "Deploy failed for service payments in region us east"),
+        _issue("A-3", "Deploy failed for service billing in region us east"),
+    ]
+    assert _ids(find_duplicates(issues)) == [["A-1", "A-2"]]
+
+
+def test_signatures_are_rehashed_only_when_the_title_changes(tmp_path, monkeypatch):
+    path = tmp_path / "title_signatures.json"
+    store = SignatureStore(path)
+    first = store.signature(_issue("A-1", "Login page crashes"))
+    store.save()
+
+    calls = []
+    real_minhash = duplicates.minhash
+    monkeypatch.setattr(duplicates, "minhash", lambda text: calls.append(text) or real_minhash(text))
+
+    reloaded = SignatureStore(path)
+    # Punctuation and case do not change the normalized title.
+    assert reloaded.signature(_issue("A-1", "LOGIN page crashes!")) == first
+    assert calls == []
+    assert reloaded.signature(_issue("A-1", "Login page hangs")) != first
+    assert calls == ["login page hangs"]
+
+
+def test_store_drops_least_recently_used_signatures_on_save(tmp_path):
+    path = tmp_path / "title_signatures.json"
+    store = SignatureStore(path, max_entries=2)
+    for key in ("A-1", "A-2", "A-3"):
+        store.signature(_issue(key, f"Issue {key}"))
+    store.signature(_issue("A-1", "Issue A-1"))
+    store.save()
+
+    saved = json.loads(path.read_text(encoding="utf-8"))["signatures"]
+    assert sorted(saved) == ["A-1", "A-3"]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.clients import jira_client
+from src.core.clients.jira_client import JiraClient
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self.data
+
+
+def _client() -> JiraClient:
+    return JiraClient("https://jira.example", "me", "token")
+
+
+def test_fetch_all_assignees_pages_until_empty(monkeypatch):
+    users = [{"displayName": f"User {i}", "accountType": "atlassian"} for i in range(250)]
+    users.append({"displayName": "Build bot", "accountType": "app"})
+    requested = []
+
+    def fake_get(url, params=None, **kwargs):
+        requested.append(params["startAt"])
+        # Jira caps the page at 100 whatever maxResults asks for.
+        return _Response(users[params["startAt"]:params["startAt"] + 100])
+
+    monkeypatch.setattr(jira_client.requests, "get", fake_get)
+    names = _client().fetch_all_assignees(page_size=1000)
+    assert len(names) == 250
+    assert "Build bot" not in names
+    assert requested == [0, 100, 200, 251]
+
+
+def _item(key: str, summary: str, issue_id: str = "") -> dict:
+    return {"id": issue_id or key.split("-")[1], "key": key, "fields": {"summary": summary, "status": {"name": "Open"}}}
+
+
+def test_refresh_issues_batches_and_reports_changes_and_missing_keys(monkeypatch):
+    client = _client()
+    remote = {f"A-{i}": _item(f"A-{i}", f"Issue {i}", issue_id=str(1000 + i)) for i in range(250)}
+    remote["A-7"]["fields"]["summary"] = "Renamed"
+    del remote["A-9"]
+    batches = []
+
+    def fake_bulk_fetch(keys, fields):
+        batches.append(list(keys))
+        return [remote[key] for key in keys if key in remote]
+
+    monkeypatch.setattr(client, "_bulk_fetch", fake_bulk_fetch)
+    known = [JiraClient._to_issue(_item(f"A-{i}", f"Issue {i}", issue_id=str(1000 + i))) for i in range(250)]
+
+    changed, missing = client.refresh_issues([issue.id for issue in known] + ["A-1", ""], known=known)
+    assert sorted(len(batch) for batch in batches) == [50, 100, 100]
+    assert [issue.id for issue in changed] == ["A-7"]
+    assert changed[0].title == "Renamed"
+    assert missing == ["A-9"]
+
+
+def test_refresh_issues_with_no_keys_makes_no_requests(monkeypatch):
+    client = _client()
+    monkeypatch.setattr(client, "_bulk_fetch", lambda keys, fields: pytest.fail("unexpected request"))
+    assert client.refresh_issues([]) == ([], [])
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from src.core.clients.jira_client import JiraClient
+from src.core.clients.jql import JqlQuery, QueryResultCache
+from src.models.issue import Issue
+
+
+def _issue(key: str, status: str = "Open", labels=()) -> Issue:
+    return Issue(id=key, title=key, status=status, labels=list(labels))
+
+
+def test_parse_rejects_unsupported_jql():
+    for jql in [
+        "project = A OR project = B",
+        "NOT status = Done",
+        "(status = Done)",
+        "assignee = currentUser()",
+        "assignee IN membersOf(devs)",
+        "resolution = EMPTY",
+        "labels IN ()",
+        "status = ",
+    ]:
+        assert JqlQuery.parse(jql) is None, jql
+
+
+def test_canonical_form_is_order_and_case_insensitive():
+    left = JqlQuery.parse("status in (Done, Open, Done) AND project = ABC order by updated desc")
+    right = JqlQuery.parse("project IN (ABC) AND status = Open AND status IN (Open, Done) ORDER BY updated DESC")
+    assert left.to_jql() == "project IN (ABC) AND status IN (Done, Open) ORDER BY updated DESC"
+    assert right.to_jql() == (
+        "project IN (ABC) AND status IN (Done, Open) AND status IN (Open) ORDER BY updated DESC"
+    )
+    assert left == JqlQuery.parse("project = ABC AND status IN (Open, Done) ORDER BY updated DESC")
+
+
+def test_repeated_clauses_on_one_field_are_kept():
+    query = JqlQuery.parse("labels = a AND labels = b")
+    assert query.to_jql() == "labels IN (a) AND labels IN (b)"
+
+
+def test_field_tokens_are_kept_as_written():
+    assert JqlQuery.parse('"Epic Link" = ABC-1').to_jql() == '"Epic Link" IN ("ABC-1")'
+    assert JqlQuery.parse("cf[10010] ~ \"needs review\"").to_jql() == 'cf[10010] ~ "needs review"'
+
+
+def test_sort_key_reads_first_order_by_field():
+    assert JqlQuery.parse("project = A ORDER BY updated DESC, key ASC").sort_key() == ("updated", True)
+    assert JqlQuery.parse("project = A ORDER BY updated, key DESC").sort_key() == ("updated", False)
+    assert JqlQuery.parse("project = A").sort_key() == ("", False)
+
+
+def test_split_chunks_only_oversized_in_lists():
+    keys = [f"K-{i}" for i in range(250)]
+    query = JqlQuery.from_filters({"key": keys, "status": ["Open"]})
+    parts = query.split(100)
+    assert len(parts) == 3
+    seen = []
+    for part in parts:
+        key_clause = next(c for c in part.clauses if c[0] == "key")
+        assert len(key_clause[2]) <= 100
+        assert ("status", "in", ("Open",)) in part.clauses
+        seen.extend(key_clause[2])
+    assert sorted(seen) == sorted(keys)
+    assert query.split(1000) == [query]
+
+
+def test_is_subset_of():
+    broad = JqlQuery.parse("project = A AND status IN (Open, Done)")
+    assert JqlQuery.parse("project = A AND status = Open").is_subset_of(broad)
+    assert JqlQuery.parse("project = A AND status = Open AND labels = x").is_subset_of(broad)
+    assert not JqlQuery.parse("project = A AND status = Closed").is_subset_of(broad)
+    assert not JqlQuery.parse("status = Open").is_subset_of(broad)
+    assert not JqlQuery.parse("project = A AND status != Open").is_subset_of(
+        JqlQuery.parse("project = A AND status != Done")
+    )
+
+
+def test_matches_local_fields():
+    query = JqlQuery.parse("project = A AND labels IN (x) AND labels IN (y)")
+    assert query.matches(_issue("A-1", labels=["x", "y"]))
+    assert not query.matches(_issue("A-2", labels=["x"]))
+    assert not query.matches(_issue("B-1", labels=["x", "y"]))
+
+
+def test_cache_serves_exact_and_narrower_queries():
+    cache = QueryResultCache()
+    broad = JqlQuery.parse("project = A ORDER BY updated DESC")
+    issues = [_issue("A-1", "Open"), _issue("A-2", "Done")]
+    cache.put(broad, 50, issues)
+
+    assert cache.get(broad, 50) is issues
+    narrow = JqlQuery.parse("project = A AND status = Done ORDER BY updated DESC")
+    assert [i.id for i in cache.get(narrow, 50)] == ["A-2"]
+    # Text clauses cannot be checked locally, and a truncated page is not a full result.
+    assert cache.get(JqlQuery.parse('project = A AND text ~ "x" ORDER BY updated DESC'), 50) is None
+    cache.clear()
+    assert cache.get(broad, 50) is None
+
+
+def test_cache_ignores_truncated_results_and_expires():
+    cache = QueryResultCache(ttl=0)
+    broad = JqlQuery.parse("project = A")
+    cache.put(broad, 1, [_issue("A-1")])
+    assert cache.get(broad, 1) is None
+
+    cache = QueryResultCache()
+    cache.put(broad, 1, [_issue("A-1")])
+    assert cache.get(JqlQuery.parse("project = A AND status = Open"), 1) is None
+
+
+def test_search_sends_original_jql_unless_split(monkeypatch):
+    client = JiraClient("https://jira.example", "me", "token", max_in_values=2)
+    sent = []
+
+    def fake_search(jql, fields, max_results):
+        sent.append(jql)
+        number = len(sent)
+        return [
+            {"key": f"A-{number}", "fields": {"updated": f"2024-05-0{number}T10:00:00.000+0000"}},
+            {"key": "A-9", "fields": {"updated": "2024-04-01T10:00:00.000+0000"}},
+        ]
+
+    monkeypatch.setattr(client, "_search", fake_search)
+
+    jql = '"Epic Link" = ABC-1 AND labels = a AND labels = b'
+    client.fetch_raw_issues(jql=jql)
+    assert sent == [jql]
+
+    sent.clear()
+    items = client.fetch_raw_issues(jql="key IN (A-1, A-2, A-3) ORDER BY updated DESC, key ASC", max_results=3)
+    assert len(sent) == 2
+    assert [item["key"] for item in items] == ["A-2", "A-1", "A-9"]
+
+
+def test_ids_are_left_to_jira():
+    cache = QueryResultCache()
+    broad = JqlQuery.parse("project = A")
+    cache.put(broad, 50, [_issue("A-1")])
+    for jql in [
+        'project = A AND assignee = "5b10ac8d82e05b22cc7d4ef5"',
+        'project = A AND assignee = "557058:f58131cb-b67d-43c7-b30d-6b58d40bd077"',
+        'project = A AND assignee = "me@example.com"',
+        "project = A AND status = 10001",
+        "project = A AND issuetype = 10002",
+        'project = A AND project = "My Project"',
+        "project = A AND key = 10042",
+    ]:
+        query = JqlQuery.parse(jql)
+        assert not query.locally_evaluable(), jql
+        assert cache.get(query, 50) is None, jql
+
+
+def test_not_equal_clauses_are_local():
+    issues = [_issue("A-1", "Open", ["x"]), _issue("A-2", "Done"), _issue("A-3", "Open")]
+    query = JqlQuery.parse("status != Done AND labels != y")
+    assert [i.id for i in query.filter(issues)] == ["A-1"]
+
+
+def test_local_part_keeps_only_decidable_clauses():
+    query = JqlQuery.parse("project = A AND updated >= -30d AND status != Done")
+    assert query.local_part().to_jql() == "project IN (A) AND status != Done"
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+import tracemalloc
+
+import pytest
+
+from src.utils.profiler import StageProfiler
+
+
+def test_tracing_stops_when_the_run_ends_early(tmp_path):
+    profiler = StageProfiler(tmp_path, enabled=True)
+    with pytest.raises(KeyError):
+        with profiler:
+            with profiler.stage("fetch"):
+                raise KeyError("boom")
+    assert not tracemalloc.is_tracing()
+    assert [stage["stage"] for stage in profiler.stages] == ["fetch"]
+
+    folded_path, table_path = profiler.write()
+    assert "fetch" in table_path.read_text(encoding="utf-8")
+    assert folded_path.exists()
+
+
+def test_concurrent_profiled_runs_take_turns(tmp_path):
+    errors = []
+
+    def profiled_run(name: str) -> None:
+        try:
+            for _ in range(5):
+                profiler = StageProfiler(tmp_path / name, enabled=True, interval=0.001)
+                with profiler:
+                    with profiler.stage("work"):
+                        sum(bytearray(50_000))
+                profiler.write()
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=profiled_run, args=(f"run-{i}",)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert not tracemalloc.is_tracing()
+
+
+def test_disabled_profiler_is_a_no_op(tmp_path):
+    profiler = StageProfiler(tmp_path, enabled=False)
+    with profiler:
+        with profiler.stage("fetch"):
+            pass
+    assert profiler.stages == []
+
+
+def test_back_to_back_writes_do_not_overwrite_each_other(tmp_path):
+    paths = set()
+    for _ in range(3):
+        profiler = StageProfiler(tmp_path, enabled=True)
+        with profiler:
+            with profiler.stage("fetch"):
+                pass
+        paths.update(profiler.write())
+    assert len(paths) == 6
+    assert len(list(tmp_path.iterdir())) == 6
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from src.core.search_index import SearchIndex
+from src.models.issue import Issue
+
+
+def _index() -> SearchIndex:
+    return SearchIndex(
+        [
+            Issue(id="A-1", title="Logout broken", status="Open"),
+            Issue(id="A-2", title="Log in fails on Safari", status="Open"),
+            Issue(id="A-3", title="Crash when saving", status="Open", description="Only in C builds"),
+            Issue(id="A-4", title="Login page slow", status="Open"),
+        ]
+    )
+
+
+def test_every_token_of_a_word_must_match():
+    index = _index()
+    assert index.search("log-in") == ["A-2"]
+    assert index.search("log-in", prefix_last=False) == ["A-2"]
+
+
+def test_only_unfinished_tokens_match_as_prefixes():
+    index = _index()
+    assert index.search("c++") == ["A-3"]
+    assert index.search("cras") == ["A-3"]
+    assert sorted(index.search("log")) == ["A-1", "A-2", "A-4"]
+    assert index.search("log* page") == ["A-4"]
+
+
+def test_terms_are_anded_and_ranked():
+    index = _index()
+    assert index.search("broken logout") == ["A-1"]
+    assert index.search("broken safari") == []
+    assert index.search("+++") == []
+
+
+def test_update_and_remove():
+    index = _index()
+    index.update([Issue(id="A-1", title="Logout fixed", status="Done")])
+    assert index.search("broken") == []
+    index.remove(["A-2"])
+    assert index.search("safari") == []
+    assert len(index) == 3
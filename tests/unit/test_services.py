@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.report_generator import load_from_store
+from src.core.services.ingestion_service import WebhookIngestor, store_scope
+from src.core.services.issue_store import STORE_FILENAME, IssueStore
+from src.models.issue import Issue
+
+
+def _issue(key: str, status: str = "Open") -> Issue:
+    return Issue(id=key, title=key, status=status)
+
+
+def _event(key: str, timestamp, title: str = "Title", event: str = "jira:issue_updated") -> dict:
+    return {"webhookEvent": event, "timestamp": timestamp, "issue": {"key": key, "fields": {"summary": title}}}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [1, 2],
+        _event("A-1", "abc"),
+        {"webhookEvent": "jira:issue_updated", "issue": {"fields": {}}},
+        {"webhookEvent": "jira:issue_updated", "issue": {"key": "A-1", "fields": []}},
+    ],
+)
+def test_malformed_payloads_are_rejected_and_not_marked_seen(payload):
+    ingestor = WebhookIngestor(IssueStore())
+    with pytest.raises(ValueError):
+        ingestor.submit(payload, "delivery-1")
+    # A corrected retry with the same delivery id is still accepted.
+    assert ingestor.submit(_event("A-1", 1), "delivery-1")
+    ingestor.flush()
+    assert ingestor.store.get("A-1") is not None
+
+
+def test_redeliveries_and_stale_events_are_dropped():
+    ingestor = WebhookIngestor(IssueStore())
+    assert ingestor.submit(_event("A-1", 2, "new"), "d2")
+    assert not ingestor.submit(_event("A-1", 2, "new"), "d2")
+    assert ingestor.submit(_event("A-1", 1, "old"), "d1")
+    ingestor.flush()
+    assert ingestor.submit(_event("A-1", 0, "older"), "d0")
+    ingestor.flush()
+    assert ingestor.store.get("A-1").title == "new"
+
+    assert ingestor.submit(_event("A-1", 3, event="jira:issue_deleted"), "d3")
+    ingestor.flush()
+    assert ingestor.store.get("A-1") is None
+
+
+def test_failed_flush_keeps_the_batch(monkeypatch):
+    store = IssueStore()
+    ingestor = WebhookIngestor(store, batch_size=2)
+    original = store.apply
+
+    def broken_apply(**kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "apply", broken_apply)
+    assert ingestor.submit(_event("A-1", 1), "d1")
+    assert ingestor.submit(_event("A-2", 1), "d2")
+    with pytest.raises(OSError):
+        ingestor.flush()
+
+    monkeypatch.setattr(store, "apply", original)
+    assert ingestor.flush() == (2, 0)
+    assert len(store) == 2
+
+
+class _FakeClient:
+    def __init__(self, issues):
+        self.issues = issues
+        self.calls = []
+
+    def fetch_issues(self, jql=None, max_results=50):
+        self.calls.append((jql, max_results))
+        return list(self.issues)
+
+
+def _scoped_ingestor(store: IssueStore, jql: str) -> WebhookIngestor:
+    return WebhookIngestor(store, scope=store_scope({"jira_default_jql": jql}))
+
+
+def test_scope_is_enforced_as_events_arrive():
+    ingestor = _scoped_ingestor(IssueStore(), "project = A AND status != Done AND updated >= -30d")
+    assert ingestor.scope.to_jql() == "project IN (A) AND status != Done"
+
+    ingestor.submit(_event("A-1", 1), "d1")
+    ingestor.submit(_event("B-1", 1), "d2")
+    ingestor.flush()
+    assert [issue.id for issue in ingestor.store.issues()] == ["A-1"]
+
+    done = _event("A-1", 2)
+    done["issue"]["fields"]["status"] = {"name": "Done"}
+    ingestor.submit(done, "d3")
+    ingestor.flush()
+    assert len(ingestor.store) == 0
+
+    ingestor.submit(_event("A-1", 3), "d4")
+    ingestor.flush()
+    assert ingestor.store.get("A-1") is not None
+
+
+def test_seed_fills_an_empty_store_and_prunes_out_of_scope_issues(tmp_path):
+    path = tmp_path / "issues.json"
+    client = _FakeClient([_issue("A-1"), _issue("A-2", "Done")])
+    ingestor = _scoped_ingestor(IssueStore(path), "project = A AND status != Done")
+    ingestor.seed(client, "project = A AND status != Done", limit=10)
+    assert client.calls == [("project = A AND status != Done", 10)]
+    assert [issue.id for issue in IssueStore(path).issues()] == ["A-1"]
+
+    # A non-empty store is not re-fetched, but a narrower scope prunes it.
+    ingestor = _scoped_ingestor(IssueStore(path), "project = A AND status = Closed")
+    ingestor.seed(client, "project = A AND status = Closed")
+    assert len(client.calls) == 1
+    assert len(IssueStore(path)) == 0
+
+
+def test_reports_only_read_the_store(tmp_path):
+    settings = {"cache_output_dir": str(tmp_path), "jira_default_jql": "project = A"}
+    with pytest.raises(ValueError):
+        load_from_store(settings)
+
+    store = IssueStore(tmp_path / STORE_FILENAME)
+    store.replace_all([_issue("A-1"), _issue("A-2", "Done")], version=1)
+    store.save()
+    assert [issue.id for issue in load_from_store(settings, "status = Done")] == ["A-2"]
+    with pytest.raises(ValueError):
+        load_from_store(settings, "project = A AND updated >= -30d")
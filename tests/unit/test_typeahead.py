@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+
+from src.core.typeahead import PrefixIndex, TypeaheadStore
+
+
+class _FakeClient:
+    def __init__(self, assignees, labels):
+        self.assignees = assignees
+        self.labels = labels
+        self.fail = False
+        self.calls = 0
+        self.called = threading.Event()
+
+    def fetch_all_assignees(self):
+        self.calls += 1
+        self.called.set()
+        if self.fail:
+            raise RuntimeError("Jira unavailable")
+        return list(self.assignees)
+
+    def fetch_all_labels(self):
+        return list(self.labels)
+
+
+def test_prefix_search_matches_any_word_in_order():
+    index = PrefixIndex(["Ada Lovelace", "alan turing", "Grace Hopper", "", "Ada Lovelace"])
+    assert len(index) == 3
+    assert index.search("a") == ["Ada Lovelace", "alan turing"]
+    assert index.search("HOP") == ["Grace Hopper"]
+    assert index.search("tur") == ["alan turing"]
+    assert index.search("ada love") == ["Ada Lovelace"]
+    assert index.search("x") == []
+
+
+def test_prefix_search_limits():
+    index = PrefixIndex([f"label-{i:03d}" for i in range(250)])
+    assert len(index.search("")) == 100
+    assert len(index.search("", limit=None)) == 250
+    assert index.search("label-0", limit=3) == ["label-000", "label-001", "label-002"]
+
+
+def test_refresh_swaps_indexes_and_keeps_them_on_failure():
+    client = _FakeClient(["Ada"], ["backend"])
+    store = TypeaheadStore(client)
+    assert not store.loaded
+
+    store.refresh()
+    assert store.loaded
+    assert store.assignees.values() == ["Ada"]
+    assert store.labels.search("back") == ["backend"]
+
+    client.fail = True
+    client.assignees = ["Grace"]
+    store.refresh()
+    assert isinstance(store.last_error, RuntimeError)
+    assert store.assignees.values() == ["Ada"]
+
+    client.fail = False
+    store.refresh()
+    assert store.last_error is None
+    assert store.assignees.values() == ["Grace"]
+
+
+def test_start_loads_in_the_background():
+    client = _FakeClient(["Ada"], [])
+    store = TypeaheadStore(client)
+    assert store.start() is store
+    assert store.start() is store
+    assert client.called.wait(5)
+    assert client.calls == 1